@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Basic validation script for {{skill_name}} skill
+"""
+
+import sys
+from pathlib import Path
+
+
+def _find_skill_factory():
+    """Make the skillfactory package importable if it is not installed"""
+    try:
+        import skillfactory  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    # Skills are installed side by side, so look next to this skill first
+    skill_roots = [
+        Path(__file__).resolve().parent.parent.parent,
+        Path.cwd() / ".opencode" / "skill",
+        Path.home() / ".config" / "opencode" / "skill",
+    ]
+    for root in skill_roots:
+        scripts = root / "opencode-skill-factory" / "scripts"
+        if (scripts / "skillfactory" / "__init__.py").exists():
+            sys.path.insert(0, str(scripts))
+            return
+
+
+_find_skill_factory()
+
+try:
+    from skillfactory.validator import SkillValidator
+    
+    def main():
+        """Validate this skill"""
+        skill_path = Path(__file__).parent.parent
+        validator = SkillValidator(skill_path)
+        result = validator.validate()
+        
+        if not result['valid']:
+            print("❌ Skill validation FAILED")
+            for error in result['errors']:
+                print(f"  ERROR: {error}")
+            sys.exit(1)
+        else:
+            print("✅ Skill validation PASSED")
+            
+        for warning in result['warnings']:
+            print(f"  ⚠️  WARNING: {warning}")
+        
+        for info in result['info']:
+            print(f"  ℹ️  INFO: {info}")
+    
+    if __name__ == "__main__":
+        main()
+        
+except ImportError:
+    print("⚠️  Main validation script not found. Install opencode-skill-factory to enable validation.")
+    print("   Basic checks:")
+    
+    # Basic checks
+    skill_path = Path(__file__).parent.parent
+    skill_md = skill_path / "SKILL.md"
+    
+    if skill_md.exists():
+        print(f"✅ SKILL.md exists")
+        with open(skill_md) as f:
+            content = f.read()
+            if content.startswith('---\n'):
+                print(f"✅ Frontmatter detected")
+            else:
+                print(f"❌ No frontmatter found")
+    else:
+        print(f"❌ SKILL.md missing")
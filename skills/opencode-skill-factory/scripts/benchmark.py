@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark Script for the OpenCode Skill Factory
+
+Checks that cold start of validate.py and generate.py stays within the
+budget tracked in skillfactory/startup_budget.json, and that validation and
+batch generation throughput on a synthetic corpus stays within the baseline
+tracked in skillfactory/throughput_baseline.json.
+Usage: python benchmark.py startup [--runs N] [--record]
+       python benchmark.py throughput [--skills N] [--body small|huge|mixed]
+                                      [--scripts N] [--workers N] [--corpus DIR]
+                                      [--tolerance F] [--record]
+       python benchmark.py corpus DIR [--skills N] [--body ...] [--scripts N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the skill factory scripts")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    startup = commands.add_parser("startup", help="measure cold start against its budget")
+    startup.add_argument(
+        "--runs", type=int, default=10, help="runs per command (default: 10)"
+    )
+    startup.add_argument(
+        "--record",
+        action="store_true",
+        help="write the current measurements, with headroom, as the new budget",
+    )
+
+    def add_corpus_arguments(command):
+        command.add_argument(
+            "--skills", type=int, default=1000, help="skills in the corpus (default: 1000)"
+        )
+        command.add_argument(
+            "--body",
+            choices=["small", "huge", "mixed"],
+            default="small",
+            help="SKILL.md size; mixed makes every tenth one huge (default: small)",
+        )
+        command.add_argument(
+            "--scripts", type=int, default=2, help="scripts per skill (default: 2)"
+        )
+
+    throughput = commands.add_parser(
+        "throughput", help="time generation and validation against the baseline"
+    )
+    add_corpus_arguments(throughput)
+    throughput.add_argument(
+        "-j", "--workers", type=int, default=None, help="workers passed to both scripts"
+    )
+    throughput.add_argument(
+        "--corpus",
+        type=Path,
+        default=None,
+        help="validate an existing corpus instead of writing a synthetic one",
+    )
+    throughput.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="relative slowdown or memory growth allowed (default: 0.25)",
+    )
+    throughput.add_argument(
+        "--record",
+        action="store_true",
+        help="write the current measurements as the baseline for this corpus",
+    )
+
+    corpus = commands.add_parser("corpus", help="write a synthetic corpus for profiling")
+    corpus.add_argument("directory", type=Path, help="directory to write skills into")
+    add_corpus_arguments(corpus)
+    args = parser.parse_args()
+
+    if args.command == "startup":
+        from skillfactory.benchmark import check_startup
+
+        sys.exit(check_startup(args.runs, args.record))
+
+    if args.command in ("throughput", "corpus") and args.skills < 1:
+        parser.error("--skills must be at least 1")
+
+    if args.command == "throughput":
+        from skillfactory.benchmark import check_throughput
+
+        sys.exit(
+            check_throughput(
+                args.skills,
+                args.body,
+                args.scripts,
+                args.workers,
+                args.corpus,
+                args.record,
+                args.tolerance,
+            )
+        )
+
+    if args.command == "corpus":
+        from skillfactory.benchmark import write_corpus
+
+        write_corpus(args.directory, args.skills, args.body, args.scripts)
+        print(f"✅ Wrote {args.skills} skills to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
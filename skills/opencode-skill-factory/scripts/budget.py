@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Context Budget Script for OpenCode Skills
+
+Estimates how many tokens each skill costs the agent: the name and
+description listed in every session, the SKILL.md loaded whenever the skill
+triggers, and the references/ files read on demand. Sections of SKILL.md
+over the budget in skill-config.json are flagged with a references/ file
+to move them to.
+Usage: python budget.py <skill-path> [<skill-path> ...] [--config FILE]
+                        [--sort eager|name] [--format text|json]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Estimate the context tokens OpenCode skills cost",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="skill directories, or directories to search for skills",
+    )
+    parser.add_argument(
+        "--config",
+        default=None,
+        help="skill config with the token_budget (default: assets/skill-config.json)",
+    )
+    parser.add_argument(
+        "--sort",
+        choices=["eager", "name"],
+        default="eager",
+        help="order of the skills, most costly first by default",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="output format (default: text)",
+    )
+    args = parser.parse_args()
+
+    import json
+
+    from skillfactory.budget import analyze_skill
+    from skillfactory.discovery import collect_skill_paths
+    from skillfactory.rules import load_rules
+
+    try:
+        rules = load_rules(args.config)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load config: {e}")
+        sys.exit(1)
+
+    skill_paths, missing = collect_skill_paths(args.paths)
+    for path in missing:
+        print(f"❌ Not a directory: {path}", file=sys.stderr)
+
+    reports = []
+    for skill_path in skill_paths:
+        try:
+            reports.append(analyze_skill(Path(skill_path), rules))
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"❌ Could not read {skill_path}: {e}", file=sys.stderr)
+    if args.sort == "eager":
+        reports.sort(key=lambda report: (-report["eager_tokens"], report["name"]))
+    else:
+        reports.sort(key=lambda report: report["name"])
+
+    if args.format == "json":
+        print(json.dumps({"skills": reports}, indent=2))
+    else:
+        for report in reports:
+            print(
+                f"{'⚠️ ' if report['over_budget'] else '📊'} {report['name']}: "
+                f"~{report['eager_tokens']} tokens on trigger "
+                f"(budget {rules.eager_max_tokens}), ~{report['catalog_tokens']} "
+                f"in every session, ~{report['lazy_tokens']} in references/"
+            )
+            for section in report["sections"]:
+                marker = "⚠️ " if section["move_to"] else "  "
+                print(
+                    f"  {marker}{section['tokens']:>6}  {section['title']} "
+                    f"(line {section['line']})"
+                )
+                if section["move_to"]:
+                    print(f"            → move to {section['move_to']}")
+            for relative_path, tokens in report["references"].items():
+                print(f"    {tokens:>6}  {relative_path}")
+
+        if len(reports) > 1:
+            print(
+                f"\n📊 {len(reports)} skills: "
+                f"~{sum(report['catalog_tokens'] for report in reports)} tokens in "
+                f"every session, "
+                f"{sum(1 for report in reports if report['over_budget'])} over the "
+                f"budget when triggered"
+            )
+
+    if missing or any(report["over_budget"] for report in reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Skill Compilation Script for OpenCode Skills
+
+Packs skills into a bundle file holding the parsed frontmatter, a section
+table of every SKILL.md body and the files under references/ and assets/,
+so loaders can mmap one file instead of parsing each skill.
+Usage: python compile.py <skill_path> [<skill_path> ...] [-o FILE] [--workers N]
+                         [--no-validate] [--no-cache]
+       python compile.py --show FILE
+
+A single skill or root directory is compiled into .skill-bundle inside it;
+several paths need --output. Skills are validated first, through the same
+cache as validate.py, and nothing is written if any of them is invalid.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile OpenCode skills into a bundle file",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        metavar="skill_path",
+        help="skill directory, or root directory to search for skills",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="bundle file to write (default: .skill-bundle in the only path)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes for validation (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="compile without validating the skills first",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore and do not update the validation cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="directory for the validation cache (default: .opencode/cache)",
+    )
+    parser.add_argument(
+        "--show",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="list the contents of a bundle instead of compiling",
+    )
+    args = parser.parse_args()
+
+    if args.show is None and not args.paths:
+        parser.error("give skill paths to compile or --show FILE")
+    if args.show is None and args.output is None and len(args.paths) > 1:
+        parser.error("--output is required when compiling several paths")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.show is not None:
+        from skillfactory.bundle import SkillBundle
+
+        try:
+            bundle = SkillBundle(args.show)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not open bundle: {e}")
+            sys.exit(1)
+        with bundle:
+            stale = set(bundle.stale())
+            for name, skill in sorted(bundle.skills.items()):
+                marker = "⚠️ " if name in stale else "  "
+                print(
+                    f"{marker}{name}: {skill['skill_md']['length']} bytes, "
+                    f"{len(skill['sections'])} sections, {len(skill['files'])} files"
+                    + (" (stale)" if name in stale else "")
+                )
+        return
+
+    import time
+
+    from skillfactory.bulk import validate_many
+    from skillfactory.bundle import BUNDLE_NAME, write_bundle
+    from skillfactory.cache import ValidationCache
+    from skillfactory.discovery import collect_skill_paths
+
+    skill_paths, missing = collect_skill_paths(args.paths)
+    for path in missing:
+        print(f"❌ Not a directory: {path}")
+    if missing or not skill_paths:
+        if not skill_paths:
+            print("❌ No skills found")
+        sys.exit(1)
+
+    if not args.no_validate:
+        cache = None if args.no_cache else ValidationCache(args.cache_dir)
+        invalid = [
+            result
+            for result in validate_many(skill_paths, args.workers, cache)
+            if not result["valid"]
+        ]
+        if invalid:
+            for result in invalid:
+                print(f"❌ {result['skill_path']}")
+                for error in result["errors"]:
+                    print(f"  ❌ {error}")
+            print(f"\n❌ {len(invalid)} invalid skill(s), no bundle written")
+            sys.exit(1)
+
+    output = args.output or Path(args.paths[0]) / BUNDLE_NAME
+    started = time.perf_counter()
+    try:
+        write_bundle(skill_paths, output)
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        print(f"❌ Could not write bundle: {e}")
+        sys.exit(1)
+
+    print(
+        f"✅ Compiled {len(skill_paths)} skill(s) into {output} "
+        f"({output.stat().st_size / 1024:.1f} KB) in "
+        f"{(time.perf_counter() - started) * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Skill Registry Script for OpenCode Skills
+
+Maintains an index of installed skills under .opencode/cache/index.json and
+answers lookups from it. Every run first updates the index incrementally,
+re-reading only skills whose SKILL.md changed.
+Usage: python index.py [--root DIR ...] [--list] [--name NAME] [--search TEXT]
+                       [--limit N] [--no-update] [--format text|json]
+
+Without --root the project skill directories (.opencode/skill up to the top
+of the git worktree) and the global one (~/.config/opencode/skill) are indexed.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Index installed OpenCode skills and query the index",
+    )
+    parser.add_argument(
+        "-r",
+        "--root",
+        action="append",
+        default=None,
+        metavar="DIR",
+        help="skill directory to index (repeatable; default: project and global skills)",
+    )
+    parser.add_argument("--list", action="store_true", help="list every indexed skill")
+    parser.add_argument("--name", default=None, help="show the skills with this name")
+    parser.add_argument(
+        "-s",
+        "--search",
+        default=None,
+        metavar="TEXT",
+        help="find the skills whose description best matches TEXT",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=5, help="number of search results (default: 5)"
+    )
+    parser.add_argument(
+        "--no-update",
+        action="store_true",
+        help="query the stored index without checking skills for changes",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="directory for the index (default: .opencode/cache)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="output format (default: text)",
+    )
+    args = parser.parse_args()
+
+    import json
+    import time
+
+    from skillfactory.registry import SkillRegistry
+
+    registry = SkillRegistry(args.cache_dir)
+    if not args.no_update:
+        started = time.perf_counter()
+        counts = registry.update(args.root)
+        registry.save()
+        if args.format == "text":
+            print(
+                f"📊 Indexed {len(registry.skills)} skills in "
+                f"{(time.perf_counter() - started) * 1000:.1f} ms: "
+                + ", ".join(f"{count} {what}" for what, count in counts.items())
+            )
+
+    output = {}
+    if args.list:
+        output["skills"] = sorted(
+            registry.skills.values(), key=lambda entry: (entry["name"], entry["path"])
+        )
+    if args.name:
+        output["matches"] = registry.lookup(args.name)
+    if args.search:
+        output["results"] = [
+            {"score": score, **entry}
+            for score, entry in registry.search(args.search, args.limit)
+        ]
+
+    if args.format == "json":
+        print(json.dumps(output, indent=2))
+        return
+
+    for entry in output.get("skills", []) + output.get("matches", []):
+        print(f"  {entry['name']} [{entry['scope']}] {entry['path']}")
+    if args.name and not output["matches"]:
+        print(f"❌ No skill named {args.name}")
+        sys.exit(1)
+    if args.search:
+        if not output["results"]:
+            print(f"ℹ️  No skill matches '{args.search}'")
+        for result in output["results"]:
+            print(f"  {result['score']:>7.3f}  {result['name']} [{result['scope']}]")
+            print(f"           {result['description'][:100]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Skill Overlap Script for OpenCode Skills
+
+Finds pairs of skills whose descriptions are near duplicates or whose trigger
+phrases (quoted phrases in the description and "Triggers:" lines in
+SKILL.md) collide, so the agent could pick the wrong one. Candidates come
+from MinHash LSH buckets instead of comparing every pair, so large corpora
+are checked in roughly linear time.
+Usage: python overlap.py <skill-path> [<skill-path> ...] [--config FILE]
+                         [--description-threshold X] [--trigger-threshold X]
+                         [--workers N] [--format text|json]
+
+Thresholds are Jaccard similarities of word shingles and default to the
+"overlap" settings in skill-config.json.
+"""
+
+import argparse
+import sys
+
+
+def _similarity(value: str) -> float:
+    threshold = float(value)
+    if not 0 < threshold <= 1:
+        raise argparse.ArgumentTypeError("must be greater than 0 and at most 1")
+    return threshold
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find OpenCode skills with overlapping descriptions or triggers",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="skill directories, or directories to search for skills",
+    )
+    parser.add_argument(
+        "--config",
+        default=None,
+        help="skill config with the overlap settings (default: assets/skill-config.json)",
+    )
+    parser.add_argument(
+        "--description-threshold",
+        type=_similarity,
+        default=None,
+        metavar="X",
+        help="report descriptions at least this similar (default: from the config)",
+    )
+    parser.add_argument(
+        "--trigger-threshold",
+        type=_similarity,
+        default=None,
+        metavar="X",
+        help="report trigger phrases at least this similar (default: from the config)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes for shingling (default: CPU count)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="output format (default: text)",
+    )
+    args = parser.parse_args()
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    import json
+    import time
+
+    from skillfactory.discovery import collect_skill_paths
+    from skillfactory.overlap import find_overlaps
+    from skillfactory.rules import load_rules
+
+    # Fail on a bad config before discovering skills; workers load it again
+    try:
+        load_rules(args.config)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load config: {e}")
+        sys.exit(1)
+
+    skill_paths, missing = collect_skill_paths(args.paths)
+    for path in missing:
+        print(f"❌ Not a directory: {path}", file=sys.stderr)
+
+    started = time.perf_counter()
+    try:
+        report = find_overlaps(
+            skill_paths,
+            args.config,
+            args.description_threshold,
+            args.trigger_threshold,
+            args.workers,
+        )
+    except ValueError as e:
+        print(f"❌ Invalid overlap settings: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+    for skill in report["unreadable"]:
+        print(f"❌ Could not read {skill['path']}: {skill['error']}", file=sys.stderr)
+
+    if args.format == "json":
+        print(json.dumps(report, indent=2))
+    else:
+        for pair in report["pairs"]:
+            first, second = pair["skills"]
+            print(
+                f"⚠️  {first['name']} and {second['name']}: {pair['kind']} "
+                f"{pair['similarity']:.0%} similar"
+            )
+            print(f"    {first['path']}")
+            print(f"    {second['path']}")
+            if pair.get("shared"):
+                print("    shared: " + ", ".join(f"'{shingle}'" for shingle in pair["shared"]))
+        print(
+            f"\n📊 Compared {len(report['skills'])} skills in {elapsed * 1000:.1f} ms: "
+            f"{len(report['pairs'])} overlapping pair(s)"
+        )
+
+    if missing or report["unreadable"] or report["pairs"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
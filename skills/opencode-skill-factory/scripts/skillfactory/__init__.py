@@ -0,0 +1,75 @@
+"""
+OpenCode skill factory
+
+Validation and generation of OpenCode skills. The validate.py and generate.py
+scripts next to this package are thin command line front ends.
+
+Submodules are imported lazily on first attribute access, so importing the
+package itself is nearly free:
+
+    from skillfactory import SkillValidator
+    result = SkillValidator("path/to/skill").validate()
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "SkillValidator": "validator",
+    "VALIDATOR_VERSION": "validator",
+    "add_span_hook": "validator",
+    "SkillDocument": "document",
+    "BodyIndex": "document",
+    "Section": "document",
+    "parse_simple_frontmatter": "document",
+    "Rule": "rules",
+    "RuleSet": "rules",
+    "frontmatter_rule": "rules",
+    "load_rules": "rules",
+    "ValidationCache": "cache",
+    "find_skill_dirs": "discovery",
+    "collect_skill_paths": "discovery",
+    "walk_skills": "discovery",
+    "validate_many": "bulk",
+    "SkillGenerator": "generator",
+    "load_manifest": "generator",
+    "check_specs": "generator",
+    "generate_batch": "generator",
+    "Template": "templates",
+    "TemplateSet": "templates",
+    "load_templates": "templates",
+    "SkillTransaction": "transaction",
+    "SkillRegistry": "registry",
+    "read_frontmatter": "registry",
+    "SkillResolver": "resolver",
+    "get_resolver": "resolver",
+    "scope_of_path": "resolver",
+    "ScriptCache": "scriptcheck",
+    "SkillTree": "tree",
+    "estimate_tokens": "budget",
+    "analyze_skill": "budget",
+    "SkillBundle": "bundle",
+    "write_bundle": "bundle",
+    "AgentValidator": "agent",
+    "agent_rule": "rules",
+    "generate_agents": "agent",
+    "render_agent": "agent",
+    "find_agent_files": "discovery",
+    "OverlapIndex": "overlap",
+    "find_overlaps": "overlap",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
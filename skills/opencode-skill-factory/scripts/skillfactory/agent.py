@@ -0,0 +1,490 @@
+"""
+Validation and generation of OpenCode agent definitions
+
+An agent is a single Markdown file, .opencode/agent/<name>.md or
+~/.config/opencode/agent/<name>.md, whose YAML frontmatter configures the
+agent and whose body is its system prompt. AgentValidator reuses the
+SkillValidator machinery, so agents go through the same bulk, cached and
+parallel path as skills and produce results of the same shape.
+"""
+
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .document import SkillDocument
+from .rules import Rule, agent_rule
+from .templates import TemplateSet, load_templates
+from .validator import SkillValidator
+
+PROJECT_AGENT_DIR = Path(".opencode") / "agent"
+GLOBAL_AGENT_DIR = Path(".config") / "opencode" / "agent"
+
+# Frontmatter fields OpenCode understands, in the order they are generated
+AGENT_FIELDS = (
+    "description",
+    "mode",
+    "model",
+    "temperature",
+    "top_p",
+    "steps",
+    "hidden",
+    "color",
+    "disable",
+    "prompt",
+    "tools",
+    "permission",
+)
+AGENT_SPEC_FIELDS = ("name", "scope", "path", "purpose") + AGENT_FIELDS
+
+COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class AgentValidator(SkillValidator):
+    KIND = "agent"
+    # Findings without a file are located in the agent file itself
+    MAIN_FILE = None
+
+    def validate(self) -> Dict[str, Any]:
+        """Run all validations and return results"""
+        return self._run_checks(
+            [
+                ("agent_file", self._validate_agent_file),
+                ("frontmatter", self._validate_frontmatter),
+                ("fields", self._validate_fields),
+                ("tools", self._validate_tool_permissions),
+                ("prompt", self._validate_prompt),
+            ]
+        )
+
+    def validate_rendered(self, content: str) -> Dict[str, Any]:
+        """Validate an agent file that has been rendered but not written yet"""
+        self.files = {self.skill_path.name: content.encode("utf-8")}
+        return self.validate()
+
+    def report(
+        self,
+        severity: str,
+        rule_id: str,
+        message: str,
+        file: str = None,
+        line: int = None,
+    ):
+        super().report(severity, rule_id, message, file, line)
+
+    def _required_fields(self):
+        return self.rules.agent_required_frontmatter
+
+    def _frontmatter_rules(self) -> List[Rule]:
+        return self.rules.agent_rules
+
+    def _validate_agent_file(self):
+        """Validate the file name and frontmatter fences"""
+        path = self.skill_path
+        data = self.files.get(path.name) if self.files is not None else None
+        if data is None and not path.is_file():
+            self.report("error", "agent.missing-file", f"Agent file does not exist: {path}")
+            return
+
+        if path.suffix != ".md":
+            self.report("error", "agent.extension", "Agent files must end in .md")
+
+        # OpenCode names the agent after its file
+        name = path.stem
+        if not self.rules.name_re.match(name) or len(name) > self.rules.name_max_length:
+            self.report(
+                "error",
+                "agent.name",
+                f"agent name '{name}' must be 1-{self.rules.name_max_length} "
+                "lowercase letters, numbers, and single hyphens",
+            )
+
+        try:
+            document = SkillDocument(path, data)
+        except Exception as e:
+            self.report("error", "agent.unreadable", f"Error reading agent file: {e}")
+            return
+
+        if not document.has_frontmatter:
+            self.report(
+                "error",
+                "frontmatter.missing",
+                "Agent file must start with YAML frontmatter (---\\n)",
+                line=1,
+            )
+            return
+        if not document.frontmatter_closed:
+            self.report(
+                "error",
+                "frontmatter.unclosed",
+                "Agent frontmatter must be closed with ---",
+                line=1,
+            )
+            return
+
+        self.frontmatter_str = document.frontmatter_str
+        self.document = document
+
+    def _validate_fields(self):
+        """Flag fields OpenCode does not know, usually typos"""
+        if not hasattr(self, "frontmatter"):
+            return
+        for field in self.frontmatter:
+            if field not in AGENT_FIELDS:
+                self.report(
+                    "warning",
+                    "agent.unknown-field",
+                    f"Unknown agent field: {field}",
+                    line=self.document.field_lines.get(field),
+                )
+
+    def _validate_tool_permissions(self):
+        """Check that tools and the permissions governing them agree"""
+        if not hasattr(self, "frontmatter"):
+            return
+        tools = self.frontmatter.get("tools")
+        permission = self.frontmatter.get("permission")
+        if not isinstance(tools, dict) or not isinstance(permission, dict):
+            return
+
+        for key, governed in self.rules.agent_permissions.items():
+            level = permission.get(key)
+            if level is None or not governed:
+                continue
+            values = level.values() if isinstance(level, dict) else [level]
+            # Bad levels were reported by the permission rule already
+            levels = {
+                value
+                for value in values
+                if isinstance(value, str) and value in self.rules.permission_levels
+            }
+            if not levels:
+                continue
+
+            # Tools are enabled unless set to false
+            if all(tools.get(tool) is False for tool in governed) and levels - {"deny"}:
+                self.report(
+                    "warning",
+                    "permission.unused",
+                    f"permission.{key} allows {', '.join(governed)} but "
+                    f"{'it is' if len(governed) == 1 else 'they are'} disabled in tools",
+                    line=self.document.field_lines.get("permission"),
+                )
+            if levels == {"deny"}:
+                for tool in governed:
+                    if tools.get(tool) is True:
+                        self.report(
+                            "warning",
+                            "tools.denied",
+                            f"tools.{tool} is enabled but permission.{key} is 'deny'",
+                            line=self.document.field_lines.get("tools"),
+                        )
+
+    def _validate_prompt(self):
+        """An agent without a system prompt behaves like the default agent"""
+        if not hasattr(self, "document") or "prompt" in getattr(self, "frontmatter", {}):
+            return
+        try:
+            has_body = any(line.strip() for line in self.document.iter_body_lines())
+        except (OSError, UnicodeDecodeError) as e:
+            self.report("error", "agent.unreadable", f"Error reading agent file: {e}")
+            return
+        if not has_body:
+            self.report(
+                "warning",
+                "prompt.missing",
+                "Agent has no system prompt; add one after the frontmatter or set prompt",
+            )
+
+    @agent_rule("description", "description")
+    def _validate_description(self, description: str):
+        """Validate agent description"""
+        if not isinstance(description, str):
+            self.report("error", "description.type", "description must be a string")
+            return
+
+        if len(description) < self.rules.description_min_length:
+            self.report(
+                "error",
+                "description.too-short",
+                f"description must be at least {self.rules.description_min_length} characters long",
+            )
+        elif len(description) > self.rules.description_max_length:
+            self.report(
+                "error",
+                "description.too-long",
+                f"description must not exceed {self.rules.description_max_length} characters",
+            )
+
+    @agent_rule("mode", "mode")
+    def _validate_mode(self, mode: str):
+        """Validate agent mode"""
+        if mode not in self.rules.agent_modes:
+            self.report(
+                "error",
+                "mode.invalid",
+                "mode must be one of " + ", ".join(f"'{m}'" for m in self.rules.agent_modes),
+            )
+
+    @agent_rule("model", "model")
+    def _validate_model(self, model: str):
+        """Validate model id"""
+        if not isinstance(model, str):
+            self.report("error", "model.type", "model must be a string")
+        elif "/" not in model:
+            self.report(
+                "warning",
+                "model.format",
+                f"model '{model}' should be provider/model-id, e.g. anthropic/claude-sonnet-4",
+            )
+
+    @agent_rule("temperature", "temperature")
+    def _validate_temperature(self, temperature: float):
+        """Validate sampling temperature"""
+        low, high = self.rules.temperature_range
+        if not _is_number(temperature):
+            self.report("error", "temperature.type", "temperature must be a number")
+        elif not low <= temperature <= high:
+            self.report(
+                "error", "temperature.range", f"temperature must be between {low} and {high}"
+            )
+
+    @agent_rule("top_p", "top_p")
+    def _validate_top_p(self, top_p: float):
+        """Validate nucleus sampling"""
+        low, high = self.rules.top_p_range
+        if not _is_number(top_p):
+            self.report("error", "top_p.type", "top_p must be a number")
+        elif not low <= top_p <= high:
+            self.report("error", "top_p.range", f"top_p must be between {low} and {high}")
+
+    @agent_rule("steps", "steps")
+    def _validate_steps(self, steps: int):
+        """Validate the step limit"""
+        if not isinstance(steps, int) or isinstance(steps, bool) or steps < 1:
+            self.report("error", "steps.invalid", "steps must be a positive integer")
+
+    @agent_rule("hidden", "hidden")
+    def _validate_hidden(self, hidden: bool):
+        """Validate hidden flag"""
+        if not isinstance(hidden, bool):
+            self.report("error", "hidden.type", "hidden must be true or false")
+        elif hidden and self.frontmatter.get("mode") == "primary":
+            self.report(
+                "warning",
+                "hidden.primary",
+                "hidden only applies to subagents; primary agents are always listed",
+            )
+
+    @agent_rule("color", "color")
+    def _validate_color(self, color: str):
+        """Validate UI color"""
+        if not isinstance(color, str) or not COLOR_RE.match(color):
+            self.report("error", "color.format", 'color must be a hex color like "#3B82F6"')
+
+    @agent_rule("disable", "disable")
+    def _validate_disable(self, disable: bool):
+        """Validate disable flag"""
+        if not isinstance(disable, bool):
+            self.report("error", "disable.type", "disable must be true or false")
+
+    @agent_rule("prompt", "prompt")
+    def _validate_prompt_field(self, prompt: str):
+        """Validate prompt field"""
+        if not isinstance(prompt, str) or not prompt.strip():
+            self.report("error", "prompt.type", "prompt must be a non-empty string")
+
+    @agent_rule("tools", "tools")
+    def _validate_tools(self, tools: Dict[str, Any]):
+        """Validate tool switches"""
+        if not isinstance(tools, dict):
+            self.report("error", "tools.type", "tools must be a mapping of tool names to true/false")
+            return
+        for tool, enabled in tools.items():
+            if not isinstance(enabled, bool):
+                self.report("error", "tools.value", f"tools.{tool} must be true or false")
+            # MCP tools and wildcards name tools this config can't know
+            if (
+                str(tool) not in self.rules.agent_tools
+                and "*" not in str(tool)
+                and not str(tool).startswith("mcp_")
+            ):
+                self.report("warning", "tools.unknown", f"Unknown tool: {tool}")
+
+    @agent_rule("permission", "permission")
+    def _validate_permission(self, permission: Dict[str, Any]):
+        """Validate permission levels"""
+        if not isinstance(permission, dict):
+            self.report("error", "permission.type", "permission must be a mapping")
+            return
+        levels = self.rules.permission_levels
+        allowed = "one of " + ", ".join(f"'{level}'" for level in levels)
+        for key, level in permission.items():
+            if key not in self.rules.agent_permissions:
+                self.report("warning", "permission.unknown", f"Unknown permission: {key}")
+            # bash takes a level per command pattern
+            if key == "bash" and isinstance(level, dict):
+                for command, command_level in level.items():
+                    if command_level not in levels:
+                        self.report(
+                            "error",
+                            "permission.level",
+                            f"permission.bash '{command}' must be {allowed}",
+                        )
+            elif level not in levels:
+                self.report("error", "permission.level", f"permission.{key} must be {allowed}")
+
+
+def default_agent_path(name: str, scope: str) -> Path:
+    """Install location of a new agent"""
+    if scope == "global":
+        return Path.home() / GLOBAL_AGENT_DIR / f"{name}.md"
+    return Path.cwd() / PROJECT_AGENT_DIR / f"{name}.md"
+
+
+def render_agent(spec: Dict[str, Any], templates: TemplateSet = None) -> str:
+    """Agent file for a spec: its fields as frontmatter, then a prompt scaffold"""
+    import yaml
+
+    templates = templates or load_templates()
+    frontmatter = {field: spec[field] for field in AGENT_FIELDS if field in spec}
+    name = spec["name"]
+    return templates.render(
+        "agent",
+        {
+            "agent_name": name,
+            "agent_title": name.replace("-", " "),
+            "agent_description": spec["description"],
+            "agent_purpose": spec.get("purpose", spec["description"]),
+            "agent_frontmatter": yaml.safe_dump(
+                frontmatter, sort_keys=False, allow_unicode=True, width=1000
+            ),
+        },
+    )
+
+
+def check_agent_specs(
+    specs: List[Dict[str, Any]], base_dir: Path, overwrite: bool = False
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Check agent specs before anything is written; returns (specs, errors)
+
+    Field values are checked by rendering and validating each agent, so
+    only what rendering needs is checked here: known fields, a name, a
+    scope and unique target paths.
+    """
+    from .rules import load_rules
+
+    rules = load_rules()
+    checked = []
+    errors = []
+    seen_paths = {}
+    for index, spec in enumerate(specs, 1):
+        label = f"spec {index}"
+        if not isinstance(spec, dict):
+            errors.append(f"{label}: must be a mapping")
+            continue
+        name = spec.get("name")
+        if isinstance(name, str):
+            label = f"spec {index} ({name})"
+        unknown = sorted(set(spec) - set(AGENT_SPEC_FIELDS))
+        if unknown:
+            errors.append(f"{label}: unknown field(s) {', '.join(unknown)}")
+        if not isinstance(name, str) or not rules.name_re.match(name):
+            errors.append(f"{label}: name must be lowercase letters, numbers and hyphens")
+            continue
+        if not isinstance(spec.get("description"), str):
+            errors.append(f"{label}: description is required")
+            continue
+        scope = spec.get("scope", "project")
+        if scope not in rules.scopes:
+            errors.append(f"{label}: scope must be one of {', '.join(rules.scopes)}")
+            continue
+
+        if "path" in spec:
+            path = Path(spec["path"]).expanduser()
+            if not path.is_absolute():
+                path = base_dir / path
+        else:
+            path = default_agent_path(name, scope)
+        path = path.resolve()
+        if path.name != f"{name}.md":
+            errors.append(f"{label}: path must end in {name}.md ({path})")
+            continue
+        if str(path) in seen_paths:
+            errors.append(f"{label}: same path as spec {seen_paths[str(path)]} ({path})")
+            continue
+        seen_paths[str(path)] = index
+        if not overwrite and path.exists():
+            errors.append(f"{label}: agent already exists at {path}")
+            continue
+        checked.append({**spec, "path": path})
+    return checked, errors
+
+
+def generate_agents(
+    manifest_path: str,
+    overwrite: bool = False,
+    dry_run: bool = False,
+    template_dirs: Tuple[str, ...] = (),
+    workers: int = None,
+) -> int:
+    """Generate every agent in a manifest, or none if any of them is invalid
+
+    Agent files are committed together through a SkillTransaction, so a
+    failed write leaves none of them changed; workers threads share the
+    grouped fsync.
+    """
+    from .generator import load_manifest
+    from .transaction import SkillTransaction
+
+    started = time.perf_counter()
+    try:
+        specs = load_manifest(manifest_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read manifest: {e}")
+        return 1
+
+    specs, errors = check_agent_specs(specs, Path(manifest_path).resolve().parent, overwrite)
+    templates = load_templates(tuple(template_dirs))
+    rendered = []
+    for spec in specs:
+        try:
+            content = render_agent(spec, templates)
+        except (OSError, ValueError) as e:
+            errors.append(f"{spec['name']}: {e}")
+            continue
+        result = AgentValidator(spec["path"]).validate_rendered(content)
+        if not result["valid"]:
+            errors.extend(f"{spec['name']}: {error}" for error in result["errors"])
+        rendered.append((spec, content))
+
+    if errors:
+        print(f"❌ {len(errors)} problem(s) in {manifest_path}, no agents generated:")
+        for error in errors:
+            print(f"  ❌ {error}")
+        return 1
+    if dry_run:
+        print(f"✅ All {len(rendered)} agent specs are valid")
+        return 0
+
+    sync_workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    try:
+        with SkillTransaction(sync_workers=sync_workers) as transaction:
+            for spec, content in rendered:
+                transaction.stage_file(spec["path"], content)
+            transaction.commit()
+    except OSError as e:
+        print(f"❌ Could not write agents, none were generated: {e}")
+        return 1
+    for spec, _ in rendered:
+        print(f"✅ {spec['name']} → {spec['path']}")
+
+    elapsed = time.perf_counter() - started
+    print(f"\n📊 Generated {len(rendered)} agents in {elapsed:.2f}s")
+    return 0
@@ -0,0 +1,421 @@
+"""
+Benchmarks for the OpenCode skill factory scripts
+
+Measures cold start of validate.py and generate.py in fresh interpreters and
+compares it against the budget tracked in startup_budget.json. Throughput of
+validation and batch generation is measured on synthetic skill corpora and
+compared against the baseline tracked in throughput_baseline.json.
+"""
+
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+STARTUP_BUDGET = Path(__file__).resolve().parent / "startup_budget.json"
+THROUGHPUT_BASELINE = Path(__file__).resolve().parent / "throughput_baseline.json"
+
+# Relative slowdown or memory growth tolerated before a run counts as a
+# regression; throughput varies more between runs than startup
+DEFAULT_TOLERANCE = 0.25
+
+_WORDS = (
+    "parse convert validate render deploy migrate format lint index search "
+    "archive schedule report upload resize compress encrypt audit export sync"
+).split()
+_NOUNS = (
+    "pdf csv json yaml image invoice log config schema table chart backup "
+    "docker terraform notebook spreadsheet email calendar changelog manifest"
+).split()
+
+SAMPLE_SKILL = """---
+name: sample-skill
+description: Sample skill used to time validator startup. Use when benchmarking.
+license: MIT
+---
+# Sample Skill
+
+## What this skill does
+Nothing.
+
+## When to use this skill
+Never.
+
+## Instructions
+1. None.
+
+## Examples
+None.
+"""
+
+
+def _startup_commands(workdir: Path) -> Dict[str, List[str]]:
+    skill = workdir / "sample-skill"
+    skill.mkdir(exist_ok=True)
+    (skill / "SKILL.md").write_text(SAMPLE_SKILL, encoding="utf-8")
+    cache = ["--cache-dir", str(workdir / "cache")]
+    return {
+        "validate --help": [str(SCRIPTS_DIR / "validate.py"), "--help"],
+        "generate --help": [str(SCRIPTS_DIR / "generate.py"), "--help"],
+        "validate cached skill": [str(SCRIPTS_DIR / "validate.py"), str(skill), *cache],
+    }
+
+
+def _command_failed(args: List[str], status: int) -> RuntimeError:
+    # A command that dies at once would otherwise look very fast
+    return RuntimeError(
+        f"{' '.join(Path(arg).name if os.sep in arg else arg for arg in args)} "
+        f"exited with status {status}"
+    )
+
+
+def _run(args: List[str], cwd: Path) -> float:
+    started = time.perf_counter_ns()
+    completed = subprocess.run(
+        [sys.executable, *args],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    elapsed = (time.perf_counter_ns() - started) / 1e6
+    if completed.returncode != 0:
+        raise _command_failed(args, completed.returncode)
+    return elapsed
+
+
+def _count_imports(args: List[str], cwd: Path) -> int:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    return sum(1 for line in result.stderr.splitlines() if line.startswith("import time:"))
+
+
+def measure_startup(runs: int = 10) -> Dict[str, Dict[str, float]]:
+    """Median wall time and number of imported modules per command"""
+    baseline_args = ["-c", "pass"]
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        commands = _startup_commands(workdir)
+        interpreter = statistics.median(
+            _run(baseline_args, workdir) for _ in range(runs)
+        )
+        interpreter_imports = _count_imports(baseline_args, workdir)
+
+        measurements = {}
+        for name, args in commands.items():
+            # The first run warms the OS page cache and the validation cache
+            _run(args, workdir)
+            wall_ms = statistics.median(_run(args, workdir) for _ in range(runs))
+            measurements[name] = {
+                "wall_ms": round(wall_ms, 1),
+                # Time and modules on top of a bare interpreter, which are
+                # what this code controls
+                "overhead_ms": round(max(0.0, wall_ms - interpreter), 1),
+                "imports": _count_imports(args, workdir) - interpreter_imports,
+            }
+    return measurements
+
+
+def check_startup(runs: int = 10, record: bool = False) -> int:
+    """Print startup measurements and compare them with the tracked budget"""
+    try:
+        measurements = measure_startup(runs)
+    except RuntimeError as e:
+        print(f"❌ Startup benchmark failed: {e}")
+        return 1
+
+    if record:
+        # Leave headroom for noisy machines; imports are deterministic
+        budget = {
+            name: {
+                "overhead_ms": round(max(20.0, values["overhead_ms"] * 2), 1),
+                "imports": values["imports"] + 5,
+            }
+            for name, values in measurements.items()
+        }
+        with open(STARTUP_BUDGET, "w", encoding="utf-8") as f:
+            json.dump(budget, f, indent=2)
+            f.write("\n")
+        print(f"📝 Recorded startup budget in {STARTUP_BUDGET}")
+
+    with open(STARTUP_BUDGET, "r", encoding="utf-8") as f:
+        budget = json.load(f)
+
+    failed = False
+    print(f"  {'command':<24} {'wall ms':>8} {'overhead':>9} {'budget':>7} {'imports':>8} {'budget':>7}")
+    for name, values in measurements.items():
+        limit = budget.get(name, {})
+        over = values["overhead_ms"] > limit.get("overhead_ms", float("inf")) or values[
+            "imports"
+        ] > limit.get("imports", float("inf"))
+        failed |= over
+        print(
+            f"{'❌' if over else '✅'} {name:<24} {values['wall_ms']:>8.1f} "
+            f"{values['overhead_ms']:>9.1f} {limit.get('overhead_ms', '-'):>7} "
+            f"{values['imports']:>8} {limit.get('imports', '-'):>7}"
+        )
+
+    if failed:
+        print("\n❌ Cold start is over budget")
+        return 1
+    print("\n✅ Cold start is within budget")
+    return 0
+
+
+def _skill_body(rng: random.Random, name: str, huge: bool) -> str:
+    """Markdown body of a synthetic skill"""
+    title = name.replace("-", " ").title()
+    lines = [
+        f"# {title}",
+        "",
+        "## What this skill does",
+        f"Helps {rng.choice(_WORDS)} {rng.choice(_NOUNS)} files.",
+        "",
+        "## When to use this skill",
+        f"When a task involves {rng.choice(_NOUNS)} files.",
+        "",
+        "## Instructions",
+    ]
+    steps = 400 if huge else 4
+    for step in range(1, steps + 1):
+        lines.append(
+            f"{step}. {rng.choice(_WORDS).capitalize()} the {rng.choice(_NOUNS)} "
+            f"with `scripts/` helpers, then {rng.choice(_WORDS)} the result."
+        )
+    lines += ["", "## Examples", "```bash", f"python scripts/{name}-0.py input", "```"]
+    if huge:
+        for section in range(40):
+            lines += ["", f"### Example {section}", ""]
+            lines += [
+                " ".join(rng.choice(_WORDS + _NOUNS) for _ in range(16))
+                for _ in range(25)
+            ]
+    lines += ["", "See [the reference](references/reference.md) for details.", ""]
+    return "\n".join(lines)
+
+
+def write_corpus(
+    root: Path, skills: int = 1000, body: str = "small", scripts: int = 2, seed: int = 0
+) -> Path:
+    """Write a synthetic corpus of skills below root
+
+    body is "small" (a short SKILL.md), "huge" (about 100 KB) or "mixed"
+    (every tenth skill huge). Each skill gets scripts helper scripts,
+    alternating Python and shell, and one reference file. The same arguments
+    always produce the same corpus.
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    for index in range(skills):
+        name = f"{rng.choice(_WORDS)}-{rng.choice(_NOUNS)}-{index:06d}"
+        skill_dir = root / name
+        (skill_dir / "references").mkdir(parents=True, exist_ok=True)
+        huge = body == "huge" or (body == "mixed" and index % 10 == 0)
+        description = (
+            f"{rng.choice(_WORDS).capitalize()} and {rng.choice(_WORDS)} "
+            f"{rng.choice(_NOUNS)} files. Use when working with "
+            f"{rng.choice(_NOUNS)} or {rng.choice(_NOUNS)} data."
+        )
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: {description}\nlicense: MIT\n---\n"
+            + _skill_body(rng, name, huge),
+            encoding="utf-8",
+        )
+        (skill_dir / "references" / "reference.md").write_text(
+            f"# {name} reference\n\nBack to [the skill](../SKILL.md).\n",
+            encoding="utf-8",
+        )
+        if scripts:
+            (skill_dir / "scripts").mkdir(exist_ok=True)
+        for number in range(scripts):
+            if number % 2:
+                script = skill_dir / "scripts" / f"{name}-{number}.sh"
+                script.write_text(
+                    f'#!/bin/sh\nset -eu\necho "{name} step {number}: $1"\n',
+                    encoding="utf-8",
+                )
+            else:
+                script = skill_dir / "scripts" / f"{name}-{number}.py"
+                script.write_text(
+                    "#!/usr/bin/env python3\nimport sys\n\n\n"
+                    f"def main():\n    print({name!r}, {number}, sys.argv[1:])\n\n\n"
+                    'if __name__ == "__main__":\n    main()\n',
+                    encoding="utf-8",
+                )
+            script.chmod(0o755)
+    return root
+
+
+def _write_manifest(path: Path, skills: int, target: Path, seed: int = 0):
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(skills):
+            name = f"{rng.choice(_WORDS)}-{rng.choice(_NOUNS)}-{index:06d}"
+            spec = {
+                "name": name,
+                "description": (
+                    f"{rng.choice(_WORDS).capitalize()} {rng.choice(_NOUNS)} files. "
+                    f"Use when working with {rng.choice(_NOUNS)} data."
+                ),
+                "scope": "project",
+                "license": "MIT",
+                "path": str(target / name),
+            }
+            f.write(json.dumps(spec) + "\n")
+
+
+def _run_measured(args: List[str], cwd: Path) -> Tuple[float, Optional[float]]:
+    """Wall seconds and peak RSS in MB of a command and the workers it waits for"""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, *args],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if not hasattr(os, "wait4"):
+        if process.wait() != 0:
+            raise _command_failed(args, process.returncode)
+        return time.perf_counter() - started, None
+
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - started
+    # Reaped here, so Popen must not wait for it again
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise _command_failed(args, process.returncode)
+    # Linux reports kilobytes, macOS bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return elapsed, round(usage.ru_maxrss / divisor, 1)
+
+
+def corpus_label(skills: int, body: str, scripts: int) -> str:
+    """Baseline key of a corpus configuration"""
+    return f"{skills} {body} skills, {scripts} scripts"
+
+
+def measure_throughput(
+    skills: int = 1000,
+    body: str = "small",
+    scripts: int = 2,
+    workers: int = None,
+    corpus: Path = None,
+) -> Dict[str, Dict[str, float]]:
+    """Skills per second and peak RSS of generation and validation
+
+    Validation runs twice over the same corpus: once with an empty cache and
+    once more, when every result comes from the cache. A corpus is written
+    to a temporary directory unless an existing one is given.
+    """
+    jobs = ["-j", str(workers)] if workers else []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        if corpus is None:
+            corpus = write_corpus(workdir / "corpus", skills, body, scripts)
+        else:
+            skills = sum(1 for entry in Path(corpus).iterdir() if (entry / "SKILL.md").is_file())
+
+        manifest = workdir / "manifest.jsonl"
+        _write_manifest(manifest, skills, workdir / "generated")
+        validate = [
+            str(SCRIPTS_DIR / "validate.py"),
+            str(corpus),
+            "--cache-dir",
+            str(workdir / "cache"),
+            "--format",
+            "jsonl",
+            *jobs,
+        ]
+        phases = {
+            "generate": [str(SCRIPTS_DIR / "generate.py"), "-m", str(manifest), *jobs],
+            "validate full": validate,
+            "validate cached": validate,
+        }
+
+        measurements = {}
+        for name, args in phases.items():
+            seconds, peak_rss_mb = _run_measured(args, workdir)
+            measurements[name] = {
+                "seconds": round(seconds, 3),
+                "per_second": round(skills / seconds, 1),
+                "peak_rss_mb": peak_rss_mb,
+            }
+    return measurements
+
+
+def check_throughput(
+    skills: int = 1000,
+    body: str = "small",
+    scripts: int = 2,
+    workers: int = None,
+    corpus: Path = None,
+    record: bool = False,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> int:
+    """Print throughput measurements and compare them with the tracked baseline"""
+    try:
+        measurements = measure_throughput(skills, body, scripts, workers, corpus)
+    except RuntimeError as e:
+        print(f"❌ Throughput benchmark failed: {e}")
+        return 1
+    label = corpus_label(skills, body, scripts) if corpus is None else str(corpus)
+
+    try:
+        with open(THROUGHPUT_BASELINE, "r", encoding="utf-8") as f:
+            baselines = json.load(f)
+    except (OSError, ValueError):
+        baselines = {}
+
+    if record:
+        baselines[label] = {
+            name: {"per_second": values["per_second"], "peak_rss_mb": values["peak_rss_mb"]}
+            for name, values in measurements.items()
+        }
+        with open(THROUGHPUT_BASELINE, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2)
+            f.write("\n")
+        print(f"📝 Recorded throughput baseline for {label} in {THROUGHPUT_BASELINE}")
+
+    baseline = baselines.get(label, {})
+    if not baseline:
+        print(f"ℹ️  No baseline for {label}; run with --record to create one")
+
+    failed = False
+    print(f"📊 {label}")
+    print(f"  {'phase':<16} {'seconds':>8} {'skills/s':>9} {'baseline':>9} {'peak MB':>8} {'baseline':>9}")
+    for name, values in measurements.items():
+        limit = baseline.get(name, {})
+        slower = values["per_second"] < limit.get("per_second", 0) * (1 - tolerance)
+        bigger = (
+            values["peak_rss_mb"] is not None
+            and limit.get("peak_rss_mb") is not None
+            and values["peak_rss_mb"] > limit["peak_rss_mb"] * (1 + tolerance)
+        )
+        over = slower or bigger
+        failed |= over
+        print(
+            f"{'❌' if over else '✅'} {name:<16} {values['seconds']:>8.2f} "
+            f"{values['per_second']:>9.1f} {limit.get('per_second', '-'):>9} "
+            f"{values['peak_rss_mb'] if values['peak_rss_mb'] is not None else '-':>8} "
+            f"{limit.get('peak_rss_mb', '-'):>9}"
+        )
+
+    if failed:
+        print(f"\n❌ Throughput regressed by more than {tolerance:.0%} against the baseline")
+        return 1
+    print("\n✅ Throughput is within the baseline")
+    return 0
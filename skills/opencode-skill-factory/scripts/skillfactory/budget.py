@@ -0,0 +1,121 @@
+"""
+Context budget of OpenCode skills
+
+OpenCode lists every skill's name and description in the context of each
+session, loads the whole SKILL.md when a skill triggers, and reads files
+under references/ only when the instructions point the agent to them.
+These helpers estimate what each of those costs in tokens.
+
+Tokens are estimated with a regex that splits words into pieces of at most
+eight letters, numbers into groups of three digits and every other
+non-space character into its own token. That is close enough to BPE
+tokenizers on English Markdown to budget with, costs a single findall, and
+never counts more tokens than the text has characters.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .document import BodyIndex, Section, SkillDocument
+from .rules import RuleSet, load_rules
+from .tree import SkillTree
+
+TOKEN_RE = re.compile(r"[A-Za-z]{1,8}|\d{1,3}|[^\sA-Za-z\d]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate number of tokens in text"""
+    return len(TOKEN_RE.findall(text))
+
+
+def section_label(section: Section) -> str:
+    if not section.level:
+        return "text before the first heading"
+    return f"{'#' * section.level} {section.title}"
+
+
+def reference_name(section: Section) -> str:
+    """Suggested references/ file for a section that should move out"""
+    slug = re.sub(r"[^a-z0-9]+", "-", section.title.lower()).strip("-")
+    return f"references/{slug or 'details'}.md"
+
+
+def section_tokens(body_lines: List[str], first_line: int, sections: List[Section]) -> List[int]:
+    """Estimated tokens of each section, given the body as a list of lines"""
+    tokens = []
+    for number, section in enumerate(sections):
+        end = sections[number + 1].line if number + 1 < len(sections) else None
+        start = section.line - first_line
+        stop = end - first_line if end is not None else len(body_lines)
+        tokens.append(estimate_tokens("".join(body_lines[start:stop])))
+    return tokens
+
+
+def analyze_skill(skill_path: Path, rules: RuleSet = None) -> Dict[str, Any]:
+    """Token costs of a skill and the sections that should move to references/
+
+    catalog_tokens is the name and description listed in every session,
+    eager_tokens the whole SKILL.md loaded when the skill triggers, and
+    lazy_tokens the files under references/ read on demand.
+    """
+    rules = rules or load_rules()
+    skill_path = Path(skill_path)
+    data = (skill_path / "SKILL.md").read_bytes()
+    text = data.decode("utf-8")
+    document = SkillDocument(skill_path / "SKILL.md", data)
+
+    frontmatter = document.load_frontmatter() or {}
+    catalog = " ".join(
+        str(frontmatter.get(field, "")) for field in ("name", "description")
+    )
+
+    if document.body_offset is not None:
+        body_lines = data[document.body_offset :].decode("utf-8").splitlines(True)
+        first_line = document.body_line
+    else:
+        body_lines = text.splitlines(True)
+        first_line = 1
+    index = BodyIndex.scan(iter(body_lines), first_line)
+
+    sections = []
+    for section, tokens in zip(
+        index.sections, section_tokens(body_lines, first_line, index.sections)
+    ):
+        if not tokens:
+            # Blank lines before the first heading
+            continue
+        oversized = tokens > rules.section_max_tokens
+        sections.append(
+            {
+                "title": section_label(section),
+                "line": section.line,
+                "tokens": tokens,
+                "move_to": reference_name(section) if oversized else None,
+            }
+        )
+
+    references = {}
+    tree = SkillTree.scan(skill_path)
+    for relative_path in sorted(tree.files):
+        if not relative_path.startswith("references/"):
+            continue
+        try:
+            content = (skill_path / relative_path).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            # Binary files are not read into the context as text
+            continue
+        references[relative_path] = estimate_tokens(content)
+
+    eager_tokens = estimate_tokens(text)
+    return {
+        "skill_path": str(skill_path),
+        "name": frontmatter.get("name") or skill_path.name,
+        "catalog_tokens": estimate_tokens(catalog),
+        "eager_tokens": eager_tokens,
+        "eager_bytes": len(data),
+        "over_budget": eager_tokens > rules.eager_max_tokens,
+        "lazy_tokens": sum(references.values()),
+        "sections": sections,
+        "references": references,
+    }
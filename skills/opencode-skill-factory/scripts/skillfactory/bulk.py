@@ -0,0 +1,120 @@
+"""
+Bulk validation of OpenCode skills
+
+Validates skill directories and agent files, as found by
+skillfactory.discovery, in a process pool, serving unchanged ones from the
+validation cache.
+"""
+
+import os
+from typing import Any, Dict, Iterator, List
+
+from .cache import ValidationCache
+# Re-exported: discovery used to live here
+from .discovery import (  # noqa: F401
+    AGENT_DIR_NAMES,
+    SKIP_DIRS,
+    STAGING_SUFFIX,
+    collect_skill_paths,
+    find_agent_files,
+    find_skill_dirs,
+)
+from .rules import load_rules
+from .scriptcheck import ScriptCache
+from .validator import SPAN_HOOKS, SkillValidator
+
+def _validate_one(
+    skill_path: str,
+    config_path: str = None,
+    script_cache_dir: str = None,
+    fix: bool = False,
+) -> Dict[str, Any]:
+    """Validate a single skill or agent file; module level so it can run in a
+    worker process"""
+    script_cache = ScriptCache(script_cache_dir) if script_cache_dir else None
+    rules = load_rules(config_path)
+    if skill_path.endswith(".md") and os.path.isfile(skill_path):
+        from .agent import AgentValidator
+
+        return AgentValidator(skill_path, rules).validate()
+    return SkillValidator(skill_path, rules, script_cache, fix).validate()
+
+
+def _validate_chunk(skill_paths: List[str], *options) -> List[Dict]:
+    """Validate a batch of skills in one worker task"""
+    return [_validate_one(skill_path, *options) for skill_path in skill_paths]
+
+
+def validate_many(
+    skill_paths: List[str],
+    workers: int = None,
+    cache: ValidationCache = None,
+    config_path: str = None,
+    ordered: bool = True,
+    fix: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Validate several skills, in a process pool unless workers is 1
+
+    Results come back in the order of skill_paths, or with ordered=False as
+    soon as each batch finishes (cached results first). Skills found in the
+    cache are not re-validated; fresh results are stored back into it, and
+    script checks are cached next to it by content. Every result carries a
+    "cached" flag. With fix, every skill is validated again and problems that
+    can be repaired, like missing executable bits, are fixed.
+    """
+    cached = {}
+    fingerprints = {}
+    if cache is not None:
+        for skill_path in skill_paths:
+            result, fingerprint = cache.get(skill_path)
+            fingerprints[fingerprint["key"]] = fingerprint
+            if result is not None and not fix:
+                cached[skill_path] = {**result, "cached": True}
+    script_cache_dir = str(cache.cache_file.parent) if cache is not None else None
+    options = (config_path, script_cache_dir, fix)
+
+    pending = [path for path in skill_paths if path not in cached]
+    executor = None
+    if workers == 1 or len(pending) <= 1:
+        fresh = (_validate_one(path, *options) for path in pending)
+    else:
+        # Imported here: the process pool machinery dominates cold start
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        # Batch paths per task so IPC overhead stays small for large trees
+        chunksize = max(1, len(pending) // ((workers or os.cpu_count() or 1) * 4))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        futures = [
+            executor.submit(_validate_chunk, pending[i : i + chunksize], *options)
+            for i in range(0, len(pending), chunksize)
+        ]
+        done = futures if ordered else as_completed(futures)
+        fresh = (result for future in done for result in future.result())
+
+    def store(result: Dict[str, Any]) -> Dict[str, Any]:
+        if cache is not None:
+            cache.put(fingerprints[result["skill_path"]], result)
+        for hook in SPAN_HOOKS:
+            for span in result["profile"]:
+                hook({"skill_path": result["skill_path"], **span})
+        return {**result, "cached": False}
+
+    try:
+        if ordered:
+            for skill_path in skill_paths:
+                if skill_path in cached:
+                    yield cached[skill_path]
+                else:
+                    yield store(next(fresh))
+        else:
+            yield from cached.values()
+            for result in fresh:
+                yield store(result)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if cache is not None:
+            cache.save()
+            if pending:
+                # Only fresh validations add script entries
+                ScriptCache(script_cache_dir).prune()
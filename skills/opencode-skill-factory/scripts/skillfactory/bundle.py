@@ -0,0 +1,231 @@
+"""
+Precompiled skill bundles
+
+A bundle packs one or more skills into a single file so a loader needs one
+open and one mmap instead of parsing SKILL.md and opening files under
+references/ and assets/ one by one. The layout is:
+
+    MAGIC (8 bytes) | table offset (uint64) | table length (uint64)
+    payload: SKILL.md and the bundled files of every skill, back to back
+    table: UTF-8 JSON
+
+The table holds, per skill, the parsed frontmatter, the byte range of
+SKILL.md and of its body, a section table with the byte range of every
+level 1 and 2 section, and a table of contents of the bundled files. All
+offsets are absolute positions in the bundle file, so a loader reads any
+piece with a single slice of the mapping. scripts/ are not bundled: they
+are executed from the skill directory, never read into the agent's context.
+"""
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .document import BodyIndex, SkillDocument
+from .tree import SkillTree
+
+MAGIC = b"OCSKB\x00\x00\x01"
+# Bump whenever the table layout changes
+BUNDLE_VERSION = 1
+# Default file name, hidden so skill discovery and validation ignore it
+BUNDLE_NAME = ".skill-bundle"
+BUNDLED_DIRS = ("references/", "assets/")
+
+_HEADER = struct.Struct("<8sQQ")
+
+
+def _stats(path: Path) -> List[int]:
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _skill_entry(skill_path: Path, data: bytes, base: int) -> Dict[str, Any]:
+    """Table entry of a skill whose SKILL.md is stored at offset base"""
+    document = SkillDocument(skill_path / "SKILL.md", data)
+    entry = {
+        "name": skill_path.name,
+        "path": str(skill_path.resolve()),
+        "frontmatter": document.load_frontmatter() or {},
+        "skill_md": {"offset": base, "length": len(data)},
+        "body": None,
+        "sections": [],
+        "files": {},
+        "stats": {"SKILL.md": _stats(skill_path / "SKILL.md")},
+    }
+    if document.body_offset is None:
+        return entry
+
+    entry["body"] = {
+        "offset": base + document.body_offset,
+        "length": len(data) - document.body_offset,
+        "line": document.body_line,
+    }
+    body_lines = data[document.body_offset :].splitlines(True)
+    index = BodyIndex.scan(
+        (line.decode("utf-8") for line in body_lines), document.body_line
+    )
+    # Offset of every body line, so sections map from lines to bytes
+    line_offsets = [base + document.body_offset]
+    for line in body_lines:
+        line_offsets.append(line_offsets[-1] + len(line))
+    for number, section in enumerate(index.sections):
+        start = line_offsets[section.line - document.body_line]
+        if number + 1 < len(index.sections):
+            end = line_offsets[index.sections[number + 1].line - document.body_line]
+        else:
+            end = base + len(data)
+        entry["sections"].append(
+            {
+                "title": section.title,
+                "level": section.level,
+                "line": section.line,
+                "offset": start,
+                "length": end - start,
+            }
+        )
+    return entry
+
+
+def write_bundle(skill_paths: Iterable[Path], output: Path) -> Dict[str, Any]:
+    """Compile skills into one bundle file, replacing output atomically
+
+    Skills are looked up by name in a bundle, so names must be unique.
+    Returns the table that was written.
+    """
+    output = Path(output)
+    skills = []
+    chunks = []
+    position = _HEADER.size
+
+    for skill_path in skill_paths:
+        skill_path = Path(skill_path)
+        if any(skill["name"] == skill_path.name for skill in skills):
+            raise ValueError(f"Two skills named {skill_path.name} in one bundle")
+        data = (skill_path / "SKILL.md").read_bytes()
+        entry = _skill_entry(skill_path, data, position)
+        chunks.append(data)
+        position += len(data)
+
+        tree = SkillTree.scan(skill_path)
+        for relative_path in sorted(tree.files):
+            if not relative_path.startswith(BUNDLED_DIRS):
+                continue
+            file_path = skill_path / relative_path
+            content = file_path.read_bytes()
+            entry["files"][relative_path] = {"offset": position, "length": len(content)}
+            entry["stats"][relative_path] = _stats(file_path)
+            chunks.append(content)
+            position += len(content)
+        skills.append(entry)
+
+    table = {"version": BUNDLE_VERSION, "skills": skills}
+    # YAML frontmatter may hold dates, which are stored as their ISO text
+    encoded = json.dumps(table, separators=(",", ":"), default=str).encode("utf-8")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, position, len(encoded)))
+            f.writelines(chunks)
+            f.write(encoded)
+        os.replace(tmp_file, output)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    return table
+
+
+class SkillBundle:
+    """Read-only view of a bundle file through a memory map
+
+    Only the header and the table are read when the bundle is opened; every
+    other read is a slice of the mapping, so the OS pages in just the parts
+    that are used.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, table_offset, table_length = _HEADER.unpack_from(self._map)
+            if magic != MAGIC:
+                raise ValueError(f"Not a skill bundle: {self.path}")
+            table = json.loads(self._map[table_offset : table_offset + table_length])
+            if table.get("version") != BUNDLE_VERSION:
+                raise ValueError(
+                    f"Unsupported bundle version {table.get('version')}: {self.path}"
+                )
+        except (struct.error, ValueError):
+            self._map.close()
+            raise
+        self.skills: Dict[str, Dict[str, Any]] = {
+            skill["name"]: skill for skill in table["skills"]
+        }
+
+    def __enter__(self) -> "SkillBundle":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    def _slice(self, span: Dict[str, int]) -> bytes:
+        return self._map[span["offset"] : span["offset"] + span["length"]]
+
+    def frontmatter(self, name: str) -> Dict[str, Any]:
+        return self.skills[name]["frontmatter"]
+
+    def skill_md(self, name: str) -> str:
+        """The whole SKILL.md, as loaded when the skill triggers"""
+        return self._slice(self.skills[name]["skill_md"]).decode("utf-8")
+
+    def body(self, name: str) -> str:
+        body = self.skills[name]["body"]
+        return self._slice(body).decode("utf-8") if body else ""
+
+    def section(self, name: str, title: str) -> Optional[str]:
+        """Text of the first level 1 or 2 section whose title starts with title"""
+        for section in self.skills[name]["sections"]:
+            if section["title"].startswith(title):
+                return self._slice(section).decode("utf-8")
+        return None
+
+    def files(self, name: str) -> List[str]:
+        """Bundled files of a skill, relative to the skill directory"""
+        return list(self.skills[name]["files"])
+
+    def read(self, name: str, relative_path: str) -> bytes:
+        """Content of a bundled file; KeyError if it is not in the bundle"""
+        return self._slice(self.skills[name]["files"][relative_path])
+
+    def stale(self) -> List[str]:
+        """Skills whose sources changed since the bundle was compiled
+
+        Costs a stat per bundled file and a directory walk per skill, so
+        loaders that trust their build step can skip it.
+        """
+        changed = []
+        for name, skill in self.skills.items():
+            skill_path = Path(skill["path"])
+            for relative_path, stats in skill["stats"].items():
+                try:
+                    current = _stats(skill_path / relative_path)
+                except OSError:
+                    current = None
+                if current != stats:
+                    changed.append(name)
+                    break
+            else:
+                # A file added to references/ or assets/ is not in the table
+                tree = SkillTree.scan(skill_path)
+                bundled = sum(1 for path in tree.files if path.startswith(BUNDLED_DIRS))
+                if bundled != len(skill["files"]):
+                    changed.append(name)
+        return changed
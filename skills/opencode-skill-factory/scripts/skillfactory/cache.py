@@ -0,0 +1,192 @@
+"""
+Incremental validation cache for OpenCode skills
+"""
+
+import hashlib
+import json
+import os
+import posixpath
+import time
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from .rules import RuleSet, load_rules
+from .scriptcheck import tools_signature
+from .tree import IGNORED_NAMES
+from .validator import VALIDATOR_VERSION
+
+DEFAULT_CACHE_DIR = Path(".opencode") / "cache"
+
+
+class ValidationCache:
+    """On-disk cache of validation results keyed by skill content hashes
+
+    Each entry stores the stat signature (mtime, size) of the files a skill's
+    (or agent file's) result depends on and a SHA-256 digest of their contents. A skill whose
+    stat signature is unchanged is served from the cache without reading any
+    file; a changed signature falls back to hashing, so touched-but-identical
+    files still hit. Entries are dropped when the validator version changes,
+    when the skill directory or agent file disappears, or least recently used first once
+    the cache grows beyond max_entries.
+    """
+
+    FILENAME = "validate.json"
+    # Files modified this close to a store may change again within the same
+    # mtime tick, so their stat signature is not trusted
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(
+        self, cache_dir: Path = None, max_entries: int = 50000, rules: RuleSet = None
+    ):
+        self.cache_file = Path(cache_dir or DEFAULT_CACHE_DIR) / self.FILENAME
+        # Results depend on the loaded config and the installed script
+        # checkers as well as on the validator code
+        self.version = (
+            f"{VALIDATOR_VERSION}:{(rules or load_rules()).digest}:{tools_signature()}"
+        )
+        self.max_entries = max_entries
+        self.entries = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get("version") == self.version:
+            self.entries = data.get("entries", {})
+        else:
+            self.dirty = True
+
+    def save(self):
+        """Evict stale entries and write the cache atomically"""
+        if not self.dirty:
+            return
+
+        self.entries = {
+            key: entry for key, entry in self.entries.items() if os.path.exists(key)
+        }
+        if len(self.entries) > self.max_entries:
+            keep = sorted(
+                self.entries.items(), key=lambda item: item[1]["used"], reverse=True
+            )[: self.max_entries]
+            self.entries = dict(keep)
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": self.version, "entries": self.entries}, f)
+        os.replace(tmp_file, self.cache_file)
+        self.dirty = False
+
+    def get(self, skill_path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return (cached result or None, fingerprint to pass to put)"""
+        key = str(Path(skill_path).resolve())
+        stats = _stat_signature(Path(key))
+        fingerprint = {"key": key, "stats": stats, "digest": None}
+
+        entry = self.entries.get(key)
+        if entry is None or entry["stats"] is None or entry["stats"] != stats:
+            # Hashed before validation reads the files, so an edit made
+            # while it runs leaves a digest that no longer matches
+            fingerprint["digest"] = _content_digest(Path(key), stats, self.version)
+            if entry is None or fingerprint["digest"] != entry["digest"]:
+                return None, fingerprint
+            entry["stats"] = self._trusted_stats(stats)
+
+        entry["used"] = time.time()
+        self.dirty = True
+        return entry["result"], fingerprint
+
+    def put(self, fingerprint: Dict[str, Any], result: Dict[str, Any]):
+        """Store a fresh result under the fingerprint taken before validation"""
+        if fingerprint["digest"] is None:
+            # A hit validated again, as with --fix; its entry still holds
+            return
+        self.entries[fingerprint["key"]] = {
+            "stats": self._trusted_stats(fingerprint["stats"]),
+            "digest": fingerprint["digest"],
+            "result": result,
+            "used": time.time(),
+        }
+        self.dirty = True
+
+    def _trusted_stats(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        racy_after = time.time_ns() - self.RACY_WINDOW_NS
+        if any(mtime >= racy_after for mtime, *_ in stats.values()):
+            return None
+        return stats
+
+
+def _indexed(name: str) -> bool:
+    """Whether a directory entry counts, mirroring what SkillTree indexes"""
+    return not name.startswith(".") and name not in IGNORED_NAMES
+
+
+def _stat_signature(skill_path: Path) -> Dict[str, Any]:
+    """Stat every path a skill's validation result depends on
+
+    That is every directory, whose mtime changes when entries are added,
+    removed or renamed, every Markdown file, since links are followed from
+    SKILL.md into the others, and the scripts, whose mode matters as well.
+    Directories are keyed with a trailing slash, the skill itself as "/".
+    An agent is a single file, keyed as "".
+    """
+    if skill_path.suffix == ".md" and skill_path.is_file():
+        st = os.stat(skill_path)
+        return {"": [st.st_mtime_ns, st.st_size]}
+
+    stats = {}
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            st = os.stat(skill_path / rel_dir)
+            with os.scandir(skill_path / rel_dir) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        stats[f"{rel_dir}/"] = [st.st_mtime_ns, st.st_size]
+
+        for entry in entries:
+            if not _indexed(entry.name):
+                continue
+            rel = posixpath.join(rel_dir, entry.name)
+            try:
+                if entry.is_dir():
+                    if not rel_dir or not entry.is_symlink():
+                        stack.append(rel)
+                elif rel_dir == "scripts":
+                    st = entry.stat()
+                    # chmod leaves the mtime alone but changes the result
+                    stats[rel] = [st.st_mtime_ns, st.st_size, st.st_mode & 0o777]
+                elif entry.name.endswith(".md"):
+                    st = entry.stat()
+                    stats[rel] = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                continue
+    return stats
+
+
+def _content_digest(skill_path: Path, stats: Dict[str, Any], version: str) -> str:
+    """Hash the contents behind a stat signature together with the rule version"""
+    digest = hashlib.sha256(version.encode())
+    for rel in sorted(stats):
+        digest.update(b"\0" + rel.encode())
+        path = skill_path / rel.rstrip("/")
+        try:
+            if rel.endswith("/"):
+                for name in sorted(filter(_indexed, os.listdir(path))):
+                    digest.update(b"\0" + name.encode())
+            else:
+                if len(stats[rel]) > 2:
+                    digest.update(b"%o" % stats[rel][2])
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 16), b""):
+                        digest.update(chunk)
+        except OSError:
+            digest.update(b"\0<unreadable>")
+    return digest.hexdigest()
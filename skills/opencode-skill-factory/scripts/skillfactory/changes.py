@@ -0,0 +1,99 @@
+"""
+Git-aware selection of the skills a change touches
+
+Maps the paths changed in a git revision range to the skills that contain
+them, the nearest ancestor directory holding a SKILL.md, so CI only
+validates what a commit can have broken. Links are never followed out of a
+skill, so a change in one skill cannot alter the result of another.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from .rules import DEFAULT_CONFIG
+
+# A change here can alter the result for every skill
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def _git(args: List[str], cwd: Optional[Path]) -> str:
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+    except OSError as e:
+        raise ValueError(f"Could not run git: {e}")
+    if completed.returncode != 0:
+        raise ValueError(completed.stderr.strip() or f"git {args[0]} failed")
+    return completed.stdout
+
+
+def git_changed_paths(revision_range: str, roots: Iterable[str]) -> List[Path]:
+    """Absolute paths that git diff --name-only reports for revision_range
+
+    git runs in the worktree of each root, once per worktree, so the roots
+    need not be in the current directory's repository; a root outside any
+    git worktree is an error. revision_range is anything git diff accepts,
+    like "origin/main...HEAD" or a single revision to compare with the
+    working tree. Deleted files are included; the skills that held them
+    still need checking.
+    """
+    tops = {}
+    for root in roots:
+        directory = Path(root) if Path(root).is_dir() else Path(root).parent
+        try:
+            top = _git(["-C", str(directory), "rev-parse", "--show-toplevel"], None)
+        except ValueError as e:
+            raise ValueError(f"{root}: {e}")
+        top = top.strip()
+        if not top:
+            # Inside a .git directory or a bare repository
+            raise ValueError(f"{root} is not inside a git worktree")
+        tops[top] = None
+
+    changed = []
+    for top in tops:
+        output = _git(["diff", "--name-only", "-z", revision_range, "--"], Path(top))
+        changed.extend(Path(top) / name for name in output.split("\0") if name)
+    return changed
+
+
+def changed_skills(
+    skill_paths: List[str], changed: Iterable[Path], config_path: str = None
+) -> List[str]:
+    """The skills among skill_paths that a set of changed paths affects
+
+    A skill is affected when it contains a changed path, and an agent file
+    when it is one. When the validator package or its config changed, every
+    skill is.
+    """
+    changed = [Path(os.path.realpath(path)) for path in changed]
+    config = Path(config_path or DEFAULT_CONFIG).resolve()
+    for path in changed:
+        if path == config or PACKAGE_DIR in path.parents:
+            return list(skill_paths)
+
+    by_dir = {os.path.realpath(path): path for path in skill_paths}
+    selected = set()
+    for path in changed:
+        # Agent files are validated on their own
+        if str(path) in by_dir:
+            selected.add(str(path))
+            continue
+        for parent in path.parents:
+            key = str(parent)
+            if key in by_dir:
+                selected.add(key)
+                break
+            if (parent / "SKILL.md").is_file():
+                # Inside a skill that is not being validated
+                break
+
+    return [path for key, path in by_dir.items() if key in selected]
@@ -0,0 +1,277 @@
+"""
+Discovery of skills and agent files under a directory tree
+
+One os.scandir pass per directory finds skill directories (those holding a
+SKILL.md) and agent files (.md files in an agent/ directory). Entry types
+come from the directory listing itself, so plain directories and files are
+never stat'ed; only symlinked directories cost a realpath.
+
+Directories in SKIP_DIRS, staging directories of interrupted generator runs
+and paths matched by .gitignore or .opencodeignore files are pruned. Ignore
+files apply the way git applies them: to their own directory and below,
+deeper files and later lines taking precedence, starting from the top of
+the git worktree the search root is in. The search root itself is never
+ignored. Symlinked directories are followed unless they point back at one
+of their ancestors, which would loop, or into a tree the walk covers
+anyway.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+# Directories never searched for skills
+SKIP_DIRS = {".git", "__pycache__", "node_modules"}
+# Directories agent files are discovered in
+AGENT_DIR_NAMES = {"agent", "agents"}
+# Suffix of the directories generated skills are staged in before they are
+# renamed into place; a crash can leave them behind
+STAGING_SUFFIX = ".skill-tmp"
+# Read in this order, so .opencodeignore can re-include what git ignores
+IGNORE_FILES = (".gitignore", ".opencodeignore")
+
+
+class IgnoreRule(NamedTuple):
+    # Directory of the ignore file, with a trailing separator
+    base: str
+    pattern: "re.Pattern"
+    negate: bool
+    directory_only: bool
+
+
+def _translate(glob: str) -> str:
+    """Regex for a gitignore glob, matched against a /-separated path"""
+    parts = []
+    i = 0
+    while i < len(glob):
+        char = glob[i]
+        if glob.startswith("**", i) and (i == 0 or glob[i - 1] == "/"):
+            if glob.startswith("**/", i):
+                parts.append("(?:.*/)?")
+                i += 3
+                continue
+            if i + 2 == len(glob):
+                parts.append(".*")
+                i += 2
+                continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = glob.find("]", i + 2)
+            if end < 0:
+                parts.append(re.escape(char))
+            else:
+                inner = glob[i + 1 : end]
+                if inner.startswith("!"):
+                    inner = "^" + inner[1:]
+                parts.append(f"[{inner}]")
+                i = end
+        elif char == "\\" and i + 1 < len(glob):
+            i += 1
+            parts.append(re.escape(glob[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return "".join(parts)
+
+
+def parse_ignore_line(line: str, base: str) -> Optional[IgnoreRule]:
+    """Rule for one line of an ignore file in directory base, or None"""
+    line = line.rstrip("\n")
+    if line.endswith(" ") and not line.endswith("\\ "):
+        line = line.rstrip(" ")
+    if not line or line.startswith("#"):
+        return None
+
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith("\\"):
+        # \# and \! stand for a literal first character
+        line = line[1:]
+    directory_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # A slash anywhere but at the end anchors the pattern to base
+    anchored = "/" in line
+    regex = _translate(line.lstrip("/"))
+    try:
+        pattern = re.compile(("" if anchored else "(?:.*/)?") + regex + r"\Z")
+    except re.error:
+        return None
+    return IgnoreRule(os.path.join(base, ""), pattern, negate, directory_only)
+
+
+def read_ignore_rules(directory: str, names=IGNORE_FILES) -> List[IgnoreRule]:
+    """Rules of the ignore files in directory, in precedence order"""
+    rules = []
+    for name in names:
+        try:
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except (OSError, UnicodeDecodeError):
+            continue
+        for line in lines:
+            rule = parse_ignore_line(line, directory)
+            if rule is not None:
+                rules.append(rule)
+    return rules
+
+
+def is_ignored(path: str, is_dir: bool, rules: Tuple[IgnoreRule, ...]) -> bool:
+    """Whether the last rule matching path, if any, ignores it"""
+    for rule in reversed(rules):
+        if rule.directory_only and not is_dir:
+            continue
+        if not path.startswith(rule.base):
+            continue
+        if rule.pattern.match(path[len(rule.base) :].replace(os.sep, "/")):
+            return not rule.negate
+    return False
+
+
+def _inherited_rules(root: str) -> Tuple[IgnoreRule, ...]:
+    """Ignore rules from the ancestors of root up to its git worktree top
+
+    Outside a worktree only the ignore files at and below root count.
+    """
+    if os.path.exists(os.path.join(root, ".git")):
+        return ()
+    ancestors = []
+    directory = os.path.dirname(root)
+    while directory != os.path.dirname(directory):
+        ancestors.append(directory)
+        if os.path.exists(os.path.join(directory, ".git")):
+            break
+        directory = os.path.dirname(directory)
+    else:
+        return ()
+
+    rules = []
+    for directory in reversed(ancestors):
+        rules.extend(read_ignore_rules(directory))
+    return tuple(rules)
+
+
+def walk_skills(
+    root: str, skills: bool = True, agents: bool = False, ignore_files: bool = True
+) -> Iterator[Path]:
+    """Lazily yield the skill directories and/or agent files under root
+
+    Results come depth first in name order, as soon as each directory is
+    listed. Skills do not nest, so nothing below a skill directory is
+    searched. With ignore_files=False, .gitignore and .opencodeignore are
+    not read.
+    """
+    root = str(root)
+    absolute_root = os.path.abspath(root)
+    real_root = os.path.realpath(root)
+    rules = _inherited_rules(absolute_root) if ignore_files else ()
+    # Real paths of symlinked trees outside root that were already walked
+    linked_trees: List[str] = []
+    # Ignore rules match absolute paths, cycle checks real ones, and results
+    # keep the prefix root was given with
+    stack = [(root, absolute_root, real_root, rules)]
+
+    while stack:
+        directory, absolute, real, rules = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        names = {entry.name for entry in entries}
+        skill_md = next((entry for entry in entries if entry.name == "SKILL.md"), None)
+        if skill_md is not None and not skill_md.is_dir():
+            if skills:
+                yield Path(directory)
+            continue
+
+        if ignore_files and not names.isdisjoint(IGNORE_FILES):
+            rules = rules + tuple(read_ignore_rules(absolute))
+        agent_dir = agents and os.path.basename(absolute) in AGENT_DIR_NAMES
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if not is_dir:
+                if (
+                    agent_dir
+                    and entry.name.endswith(".md")
+                    and not entry.name.startswith(".")
+                    and not is_ignored(os.path.join(absolute, entry.name), False, rules)
+                ):
+                    yield Path(entry.path)
+                continue
+            if entry.name in SKIP_DIRS or entry.name.endswith(STAGING_SUFFIX):
+                continue
+            entry_absolute = os.path.join(absolute, entry.name)
+            if rules and is_ignored(entry_absolute, True, rules):
+                continue
+
+            if entry.is_symlink():
+                entry_real = os.path.realpath(entry.path)
+                if _covers(entry_real, real) or _covers(real_root, entry_real):
+                    # A link to an ancestor loops; one into root is walked anyway
+                    continue
+                if any(_covers(tree, entry_real) for tree in linked_trees):
+                    continue
+                linked_trees.append(entry_real)
+            else:
+                entry_real = os.path.join(real, entry.name)
+            subdirs.append((entry.path, entry_absolute, entry_real, rules))
+
+        # Reversed so the stack pops them in name order
+        stack.extend(reversed(subdirs))
+
+
+def _covers(directory: str, path: str) -> bool:
+    """Whether path is directory or lies below it"""
+    return path == directory or path.startswith(os.path.join(directory, ""))
+
+
+def find_skill_dirs(root: str) -> Iterator[Path]:
+    """Yield every directory under root that holds a SKILL.md"""
+    return walk_skills(root)
+
+
+def find_agent_files(root: str) -> Iterator[Path]:
+    """Yield every agent file, a .md file in an agent/ directory, under root"""
+    return walk_skills(root, skills=False, agents=True)
+
+
+def collect_skill_paths(
+    paths: List[str], agents: bool = False
+) -> Tuple[List[str], List[str]]:
+    """Expand the command line paths into skill directories
+
+    With agents, agent files given directly or found under the paths are
+    included as well.
+    """
+    skill_paths = []
+    missing = []
+    seen = set()
+
+    for path in paths:
+        if agents and path.endswith(".md") and Path(path).is_file():
+            found = [Path(path)]
+        elif not Path(path).is_dir():
+            missing.append(path)
+            continue
+        else:
+            found = walk_skills(path, agents=agents)
+        for skill_path in found:
+            key = str(skill_path.resolve())
+            if key not in seen:
+                seen.add(key)
+                skill_paths.append(str(skill_path))
+    return skill_paths, missing
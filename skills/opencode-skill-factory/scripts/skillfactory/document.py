@@ -0,0 +1,292 @@
+"""
+SKILL.md parsing for OpenCode skills
+
+Streams the frontmatter and body of SKILL.md and indexes the body structure
+without holding the whole file in memory.
+"""
+
+import io
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+# Plain scalars that YAML would resolve to something other than a string
+_YAML_NON_STR = frozenset(
+    "yes no true false on off y n null ~".split()
+)
+_SIMPLE_FIELD_RE = re.compile(r"^([A-Za-z_][\w-]*):[ ]+(\S.*)$")
+
+
+def parse_simple_frontmatter(text: str) -> Dict[str, str]:
+    """Parse flat ``key: value`` frontmatter without a YAML library
+
+    Returns None for anything that is not a flat mapping of plain string
+    scalars (quotes, flow or block collections, multi-line values, comments
+    after values, numbers, booleans, null, ...), in which case the caller
+    falls back to full YAML. For the documents it accepts, the result is the
+    same as yaml.safe_load.
+    """
+    frontmatter = {}
+    for line in text.split("\n"):
+        if not line or line.startswith("#"):
+            continue
+        match = _SIMPLE_FIELD_RE.match(line)
+        if not match:
+            return None
+
+        key, value = match.group(1), match.group(2).rstrip(" ")
+        if (
+            key.lower() in _YAML_NON_STR
+            or value[0] in "-?:,[]{}#&*!|>'\"%@`0123456789+.~=<"
+            or value.lower() in _YAML_NON_STR
+            or ": " in value
+            or " #" in value
+            or value.endswith(":")
+            or not value.isprintable()
+        ):
+            return None
+        frontmatter[key] = value
+
+    return frontmatter or None
+
+
+def _load_yaml(text: str) -> Any:
+    """yaml.safe_load, using the libyaml C loader when it is available
+
+    yaml is imported on first use so skills with simple frontmatter never
+    load it.
+    """
+    import yaml
+
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+class SkillDocument:
+    """SKILL.md split into its frontmatter and a lazily streamed body
+
+    Only the frontmatter is read up front, line by line until the closing
+    ``---`` fence; the body is never held in memory and is re-read from the
+    recorded byte offset on demand. Passing data parses content that has
+    not been written to path yet, such as freshly generated skills.
+    """
+
+    FENCE = b"---\n"
+    FIELD_RE = re.compile(rb"^([A-Za-z_][\w-]*)[ \t]*:")
+
+    def __init__(self, path: Path, data: bytes = None):
+        self.path = Path(path)
+        self.data = data
+        self.has_frontmatter = False
+        self.frontmatter_closed = False
+        self.frontmatter_str = ""
+        self.body_offset = None
+        self.body_line = None
+        # Line number in SKILL.md of every top-level frontmatter key
+        self.field_lines: Dict[str, int] = {}
+        self.bytes_read = 0
+
+        with self._open() as f:
+            if f.readline() != self.FENCE:
+                return
+            self.has_frontmatter = True
+
+            frontmatter_lines = []
+            offset = len(self.FENCE)
+            for line in f:
+                offset += len(line)
+                if line == self.FENCE:
+                    self.frontmatter_closed = True
+                    self.body_offset = offset
+                    # 1-based line number in SKILL.md of the first body line
+                    self.body_line = len(frontmatter_lines) + 3
+                    break
+                match = self.FIELD_RE.match(line)
+                if match:
+                    key = match.group(1).decode("utf-8", "replace")
+                    self.field_lines.setdefault(key, len(frontmatter_lines) + 2)
+                frontmatter_lines.append(line)
+
+            self.bytes_read = f.tell()
+
+        self.frontmatter_str = b"".join(frontmatter_lines).decode("utf-8")
+
+    def load_frontmatter(self) -> Optional[Dict[str, Any]]:
+        """Frontmatter as a dict, or None if it is missing, unclosed or invalid"""
+        if not self.frontmatter_closed:
+            return None
+
+        frontmatter = parse_simple_frontmatter(self.frontmatter_str)
+        if frontmatter is None:
+            import yaml
+
+            try:
+                frontmatter = _load_yaml(self.frontmatter_str)
+            except yaml.YAMLError:
+                return None
+        return frontmatter if isinstance(frontmatter, dict) else None
+
+    def _open(self):
+        return io.BytesIO(self.data) if self.data is not None else open(self.path, "rb")
+
+    def iter_body_lines(self) -> Iterator[str]:
+        """Yield the body after the closing fence one line at a time"""
+        if self.body_offset is None:
+            return
+
+        with self._open() as f:
+            f.seek(self.body_offset)
+            for line in f:
+                self.bytes_read += len(line)
+                yield line.decode("utf-8")
+
+
+class Heading(NamedTuple):
+    level: int
+    title: str
+    line: int
+
+
+class Section(NamedTuple):
+    """Text from a level 1 or 2 heading up to the next one"""
+
+    # "" and level 0 for the text before the first heading
+    title: str
+    level: int
+    line: int
+    # Characters, an upper bound on its tokens
+    size: int
+
+
+class Link(NamedTuple):
+    # Link target without its #fragment, percent-decoded
+    target: str
+    line: int
+    image: bool
+
+
+class BodyIndex:
+    """Structural index of a SKILL.md body built in a single pass
+
+    Records the line count, every ATX heading outside fenced code, the line
+    ranges of fenced code blocks, the size of every level 1 and 2 section,
+    the relative Markdown links and images outside code, and every path
+    under references/, assets/ or scripts/ the text mentions, code included.
+    Line numbers refer to SKILL.md itself.
+    """
+
+    HEADING_RE = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+    FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+    # [text](target "title") and ![alt](target), target optionally in <>
+    LINK_RE = re.compile(
+        r"(!?)\[(?:[^\[\]]|\[[^\]]*\])*\]\(\s*(<[^>]*>|[^)\s]*)"
+        r"(?:\s+(?:\"[^\"]*\"|'[^']*'|\([^)]*\)))?\s*\)"
+    )
+    # [label]: target
+    LINK_DEFINITION_RE = re.compile(r"^ {0,3}\[[^\]]+\]:[ \t]*(<[^>]*>|\S+)")
+    CODE_SPAN_RE = re.compile(r"(`+).*?\1")
+    MENTION_RE = re.compile(
+        r"(?<![\w/.-])(?:\./)?((?:references|assets|scripts)/[\w./-]*[\w/])"
+    )
+    # Targets with a scheme (https:, mailto:, ...) are not files of the skill
+    SCHEME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:")
+
+    def __init__(self):
+        self.line_count = 1
+        self.headings: List[Heading] = []
+        self.code_blocks: List[Tuple[int, int]] = []
+        self.sections: List[Section] = []
+        self.size = 0
+        self.links: List[Link] = []
+        self.mentions: List[str] = []
+
+    @classmethod
+    def scan(cls, lines: Iterator[str], first_line: int = 1) -> "BodyIndex":
+        """Build the index from an iterator of body lines"""
+        index = cls()
+        fence = None
+        fence_start = 0
+        line_no = first_line - 1
+        section = ("", 0, first_line)
+        section_start = 0
+
+        for line_no, line in enumerate(lines, first_line):
+            if line.endswith("\n"):
+                index.line_count += 1
+            index.size += len(line)
+
+            if "references/" in line or "assets/" in line or "scripts/" in line:
+                index.mentions.extend(cls.MENTION_RE.findall(line))
+            if fence is None and "]" in line:
+                index._scan_links(line, line_no)
+
+            # Cheap first-character test keeps the regexes off ordinary lines
+            marker = line.lstrip(" ")[:1]
+            if marker not in ("#", "`", "~"):
+                continue
+
+            if fence is not None:
+                match = cls.FENCE_RE.match(line)
+                if (
+                    match
+                    and match.group(1)[0] == fence[0]
+                    and len(match.group(1)) >= len(fence)
+                    and not line[match.end() :].strip()
+                ):
+                    index.code_blocks.append((fence_start, line_no))
+                    fence = None
+                continue
+
+            if marker == "#":
+                match = cls.HEADING_RE.match(line.rstrip("\n"))
+                if match:
+                    heading = Heading(len(match.group(1)), match.group(2) or "", line_no)
+                    index.headings.append(heading)
+                    if heading.level <= 2:
+                        size = index.size - len(line) - section_start
+                        if size:
+                            index.sections.append(Section(*section, size))
+                        section = (heading.title, heading.level, heading.line)
+                        section_start = index.size - len(line)
+                continue
+
+            match = cls.FENCE_RE.match(line)
+            if match:
+                fence = match.group(1)
+                fence_start = line_no
+
+        # An unclosed fence runs to the end of the document
+        if fence is not None:
+            index.code_blocks.append((fence_start, line_no))
+        if index.size > section_start:
+            index.sections.append(Section(*section, index.size - section_start))
+        return index
+
+    def _scan_links(self, line: str, line_no: int):
+        """Record the relative links of a line outside fenced code"""
+        if "`" in line:
+            line = self.CODE_SPAN_RE.sub("", line)
+        targets = [
+            (match.group(2), match.group(1) == "!")
+            for match in self.LINK_RE.finditer(line)
+        ]
+        match = self.LINK_DEFINITION_RE.match(line)
+        if match:
+            targets.append((match.group(1), False))
+
+        for target, image in targets:
+            target = target.strip("<>").split("#", 1)[0].split("?", 1)[0]
+            if not target or target.startswith("/") or self.SCHEME_RE.match(target):
+                continue
+            if "%" in target:
+                from urllib.parse import unquote
+
+                target = unquote(target)
+            self.links.append(Link(target, line_no, image))
+
+    def find_heading(self, title: str, level: int = 2) -> Heading:
+        """Return the first heading at level whose title starts with title"""
+        for heading in self.headings:
+            if heading.level == level and heading.title.startswith(title):
+                return heading
+        return None
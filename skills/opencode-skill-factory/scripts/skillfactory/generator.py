@@ -0,0 +1,386 @@
+"""
+Skill generator for OpenCode skills
+
+Generates new skill files interactively based on user input, or in bulk from
+a manifest of skill specs.
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .resolver import get_resolver
+from .templates import TemplateSet, load_templates, skill_context
+from .transaction import SkillTransaction
+from .validator import SkillValidator
+
+SPEC_FIELDS = ("name", "description", "scope", "license", "path")
+
+# Generated files: path relative to the skill -> template
+SKILL_FILES = {
+    "SKILL.md": "skill",
+    "references/examples.md": "examples",
+    "references/troubleshooting.md": "troubleshooting",
+    "scripts/validate.py": "validate-script",
+}
+SKILL_DIRECTORIES = ("scripts", "references", "assets")
+
+
+class SkillGenerator:
+    def __init__(self, skill_info: Dict[str, Any] = None, templates: TemplateSet = None):
+        self.skill_info = dict(skill_info or {})
+        self.templates = templates or load_templates()
+        self.validation = None
+
+    def run(self):
+        """Run interactive skill generation"""
+        print("🔧 OpenCode Skill Generator")
+        print("=" * 40)
+
+        self._collect_skill_info()
+        self._validate_info()
+        self._generate_skill()
+        self._validate_generated_skill()
+
+        print(f"\n✅ Skill '{self.skill_info['name']}' generated successfully!")
+        print(f"📍 Location: {self.skill_info['path']}")
+        note = precedence_note(self.skill_info["path"])
+        if note:
+            print(f"ℹ️  {note}")
+        print(f"📝 Edit {self.skill_info['path']}/SKILL.md to customize instructions")
+
+    def _collect_skill_info(self):
+        """Collect skill information from user"""
+        while True:
+            name = input("Skill name (lowercase-with-hyphens): ").strip()
+            if self._validate_name(name):
+                self.skill_info["name"] = name
+                break
+            else:
+                print(
+                    "❌ Invalid name. Use lowercase letters, numbers, and single hyphens only."
+                )
+
+        while True:
+            description = input("Description (20-1024 chars, when to use): ").strip()
+            if 20 <= len(description) <= 1024:
+                self.skill_info["description"] = description
+                break
+            else:
+                print(
+                    f"❌ Description must be 20-1024 characters (current: {len(description)})"
+                )
+
+        # Optional scope
+        scope = input("Scope (project/global, default: project): ").strip() or "project"
+        if scope in ["project", "global"]:
+            self.skill_info["scope"] = scope
+        else:
+            print("⚠️  Invalid scope, using 'project'")
+            self.skill_info["scope"] = "project"
+
+        # Optional license
+        license_default = "MIT"
+        license_input = (
+            input(f"License (default: {license_default}): ").strip() or license_default
+        )
+        self.skill_info["license"] = license_input
+
+        # Determine path location
+        location = (
+            input("Location (1=project, 2=global, default: project): ").strip() or "1"
+        )
+        self.skill_info["path"] = default_skill_path(
+            self.skill_info["name"], "global" if location == "2" else "project"
+        )
+
+    @staticmethod
+    def _validate_name(name: str) -> bool:
+        """Validate skill name format"""
+        if not re.match(r"^[a-z0-9]+(-[a-z0-9]+)*$", name):
+            return False
+        if len(name) < 1 or len(name) > 64:
+            return False
+        return True
+
+    def _validate_info(self):
+        """Validate collected information"""
+        if not all(
+            field in self.skill_info
+            for field in ["name", "description", "scope", "license", "path"]
+        ):
+            raise ValueError("Missing required skill information")
+
+    def _generate_skill(self, transaction: SkillTransaction = None):
+        """Render, validate and write skill files and directories
+
+        With a transaction the skill is only staged and appears once the
+        caller commits; otherwise it is committed on its own.
+        """
+        files = self._render_files()
+
+        # Validate the rendered content before anything touches the disk
+        self.validation = SkillValidator(self.skill_info["path"]).validate_rendered(files)
+        if not self.validation["valid"]:
+            raise ValueError(
+                "Generated skill is invalid: " + "; ".join(self.validation["errors"])
+            )
+
+        skill_path = Path(self.skill_info["path"])
+        if transaction is not None:
+            self._stage(transaction, skill_path, files)
+            return
+
+        if skill_path.exists():
+            raise ValueError(f"Skill directory already exists: {skill_path}")
+        with SkillTransaction() as transaction:
+            self._stage(transaction, skill_path, files)
+            transaction.commit()
+
+    @staticmethod
+    def _stage(transaction: SkillTransaction, skill_path: Path, files: Dict[str, str]):
+        """Stage the rendered and validated files of a skill"""
+        transaction.stage(
+            skill_path,
+            files,
+            directories=SKILL_DIRECTORIES,
+            executable=["scripts/validate.py"],
+        )
+
+    def _render_files(self) -> Dict[str, str]:
+        """Render every generated file of this skill"""
+        context = skill_context(self.skill_info)
+        return {
+            relative_path: self.templates.render(template, context)
+            for relative_path, template in SKILL_FILES.items()
+        }
+
+    def _validate_generated_skill(self):
+        """Report the validation of the generated skill"""
+        print("\n🔍 Validating generated skill...")
+        print("✅ Skill passed validation")
+        for warning in self.validation["warnings"]:
+            print(f"  ⚠️  WARNING: {warning}")
+        for info in self.validation["info"]:
+            print(f"  ℹ️  INFO: {info}")
+
+
+def default_skill_path(name: str, scope: str) -> Path:
+    """Install location of a skill for its scope"""
+    return get_resolver().path_for(name, scope)
+
+
+def precedence_note(skill_path: Path) -> Optional[str]:
+    """Explain how an installed skill interacts with others of the same name"""
+    skill_path = Path(skill_path).resolve()
+    installed = get_resolver().resolve(skill_path.name)
+    if installed is None:
+        return None
+    if installed.path.resolve() == skill_path:
+        if installed.shadows:
+            return f"Overrides the skill of the same name at {installed.shadows[0]}"
+    elif skill_path in (path.resolve() for path in installed.shadows):
+        return f"Hidden by the {installed.scope} skill at {installed.path}"
+    return None
+
+
+def load_manifest(manifest_path: str) -> List[Dict[str, Any]]:
+    """Read skill specs from a JSON, JSON lines or YAML manifest
+
+    JSON and YAML manifests hold either a list of specs or a mapping with a
+    "skills" list; JSON lines manifests hold one spec per line.
+    """
+    path = Path(manifest_path)
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            return [json.loads(line) for line in f if line.strip()]
+        if path.suffix in (".yaml", ".yml"):
+            import yaml
+
+            data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        else:
+            data = json.load(f)
+
+    if isinstance(data, dict):
+        data = data.get("skills")
+    if not isinstance(data, list):
+        raise ValueError("manifest must be a list of skill specs or have a 'skills' list")
+    return data
+
+
+def check_specs(
+    specs: List[Dict[str, Any]], base_dir: Path, overwrite: bool = False
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Validate every manifest spec before anything is written
+
+    Returns the complete skill_info dicts and a list of errors; relative
+    paths are resolved against base_dir.
+    """
+    infos = []
+    errors = []
+    seen_paths = {}
+
+    for index, spec in enumerate(specs, 1):
+        label = f"spec {index}"
+        if not isinstance(spec, dict):
+            errors.append(f"{label}: must be a mapping")
+            continue
+
+        name = spec.get("name")
+        if isinstance(name, str):
+            label = f"spec {index} ({name})"
+        spec_errors = []
+
+        unknown = sorted(set(spec) - set(SPEC_FIELDS))
+        if unknown:
+            spec_errors.append(f"unknown fields: {', '.join(unknown)}")
+
+        if not isinstance(name, str) or not SkillGenerator._validate_name(name):
+            spec_errors.append(
+                "name must use lowercase letters, numbers, and single hyphens only"
+            )
+
+        description = spec.get("description")
+        if not isinstance(description, str) or not 20 <= len(description.strip()) <= 1024:
+            spec_errors.append("description must be a 20-1024 character string")
+
+        scope = spec.get("scope", "project")
+        if scope not in ("project", "global"):
+            spec_errors.append("scope must be either 'project' or 'global'")
+
+        license_str = spec.get("license", "MIT")
+        if not isinstance(license_str, str) or not license_str.strip():
+            spec_errors.append("license must be a non-empty string")
+
+        if spec_errors:
+            errors.extend(f"{label}: {error}" for error in spec_errors)
+            continue
+
+        if "path" in spec:
+            skill_path = Path(spec["path"]).expanduser()
+            if not skill_path.is_absolute():
+                skill_path = base_dir / skill_path
+        else:
+            skill_path = default_skill_path(name, scope)
+        skill_path = skill_path.resolve()
+
+        if skill_path.name != name:
+            errors.append(f"{label}: path must end in the skill name ({skill_path})")
+            continue
+        if str(skill_path) in seen_paths:
+            errors.append(
+                f"{label}: same path as spec {seen_paths[str(skill_path)]} ({skill_path})"
+            )
+            continue
+        seen_paths[str(skill_path)] = index
+        if not overwrite and skill_path.exists():
+            errors.append(f"{label}: skill already exists at {skill_path}")
+            continue
+
+        infos.append(
+            {
+                "name": name,
+                "description": description.strip(),
+                "scope": scope,
+                "license": license_str.strip(),
+                "path": skill_path,
+            }
+        )
+
+    return infos, errors
+
+
+def _generate_one(
+    skill_info: Dict[str, Any], templates: TemplateSet, transaction: SkillTransaction
+) -> Optional[str]:
+    """Stage one skill; returns an error message instead of raising"""
+    try:
+        generator = SkillGenerator(skill_info, templates)
+        generator._validate_info()
+        generator._generate_skill(transaction)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def generate_batch(
+    manifest_path: str,
+    workers: int = None,
+    overwrite: bool = False,
+    dry_run: bool = False,
+    template_dirs: Tuple[str, ...] = (),
+) -> int:
+    """Generate every skill in a manifest and print a summary; returns an exit code"""
+    started = time.perf_counter()
+    print("🔧 OpenCode Skill Generator (batch)")
+    print("=" * 40)
+
+    try:
+        specs = load_manifest(manifest_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read manifest: {e}")
+        return 1
+
+    infos, errors = check_specs(specs, Path(manifest_path).resolve().parent, overwrite)
+    if errors:
+        # Nothing is written unless every spec is valid
+        print(f"❌ {len(errors)} problem(s) in {manifest_path}, no skills generated:")
+        for error in errors:
+            print(f"  ERROR: {error}")
+        return 1
+
+    # Every skill renders from the same compiled templates
+    templates = load_templates(tuple(template_dirs))
+    try:
+        templates.compile_all()
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load templates: {e}")
+        return 1
+
+    if dry_run:
+        print(f"✅ All {len(infos)} specs are valid")
+        return 0
+
+    # The whole batch is one transaction: skills are staged next to their
+    # final paths, fsynced together and only then renamed into place
+    sync_workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    with SkillTransaction(sync_workers=sync_workers) as transaction:
+        if workers == 1 or len(infos) <= 1:
+            outcomes = [_generate_one(info, templates, transaction) for info in infos]
+        else:
+            # Generation is file I/O, so threads are enough and start instantly
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(
+                    executor.map(
+                        lambda info: _generate_one(info, templates, transaction), infos
+                    )
+                )
+
+        failed = sum(1 for error in outcomes if error)
+        if failed:
+            for info, error in zip(infos, outcomes):
+                if error:
+                    print(f"❌ {info['name']}: {error}")
+            print(f"\n❌ {failed} of {len(infos)} skills failed, no skills generated")
+            return 1
+
+        try:
+            transaction.commit()
+        except OSError as e:
+            print(f"❌ Could not move skills into place, no skills generated: {e}")
+            return 1
+
+    for info in infos:
+        print(f"✅ {info['name']} → {info['path']}")
+        note = precedence_note(info["path"])
+        if note:
+            print(f"  ℹ️  {note}")
+
+    elapsed = time.perf_counter() - started
+    print(f"\n📊 Generated {len(infos)} skills in {elapsed:.2f}s")
+    return 0
@@ -0,0 +1,261 @@
+"""
+Near-duplicate and trigger collision detection across skills
+
+Two skills whose descriptions or trigger phrases overlap heavily compete for
+the same requests, and the agent may load the wrong one. Comparing every
+pair is quadratic, so each skill's word shingles are reduced to a MinHash
+signature and the signatures are cut into LSH bands: only skills that land
+in the same bucket for some band become candidates, and every candidate is
+confirmed with the exact Jaccard similarity of the two shingle sets. A pass
+over the corpus is close to linear in the number of skills and never
+reports a pair below the threshold.
+
+Each of the num_perm hash functions is a 32-bit slice of one SHAKE-128
+digest of the shingle, so a signature costs one hashlib call per shingle
+and a column-wise min that runs in C.
+"""
+
+import hashlib
+import os
+import re
+import struct
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from .document import SkillDocument
+from .registry import tokenize
+from .rules import RuleSet, load_rules
+
+_QUOTED_RE = re.compile(r"[\"“]([^\"“”\n]+)[\"”]")
+# "**Triggers**: ...", "Trigger: ..." or "- **Triggers:** ..." in the body
+_TRIGGERS_LINE_RE = re.compile(r"^[\s>*_-]*triggers?[*_]*\s*:[*_]*\s*(.+)$", re.IGNORECASE)
+
+
+def trigger_phrases(description: str, body_lines: Iterable[str], rules: RuleSet) -> List[str]:
+    """Phrases that tell the agent when a skill applies
+
+    These are the quoted phrases of the description and the items of any
+    "Triggers:" line in the body. A skill without either falls back to the
+    clause after the first trigger keyword of its description ("Use when
+    ..."), as the registry weights it.
+    """
+    phrases = _QUOTED_RE.findall(description)
+    for line in body_lines:
+        match = _TRIGGERS_LINE_RE.match(line)
+        if match:
+            items = _QUOTED_RE.findall(match.group(1)) or match.group(1).split(",")
+            phrases.extend(item.strip() for item in items if item.strip())
+    if phrases:
+        return phrases
+
+    match = re.search(rf"\b(?:{rules.trigger_re.pattern})\b", description, re.IGNORECASE)
+    if match:
+        clause = re.split(r"[.;\n]", description[match.end() :], 1)[0].strip()
+        if clause:
+            return [clause]
+    return []
+
+
+def shingles(phrases: Iterable[str], size: int, rules: RuleSet) -> Set[str]:
+    """Word shingles of each phrase, without stopwords and trigger keywords
+
+    A phrase shorter than size is one shingle, so short trigger phrases
+    like "AUR" still count. Shingles never span two phrases.
+    """
+    result = set()
+    for phrase in phrases:
+        words = [
+            word for word in tokenize(phrase) if not rules.trigger_re.fullmatch(word)
+        ]
+        if len(words) <= size:
+            if words:
+                result.add(" ".join(words))
+            continue
+        for start in range(len(words) - size + 1):
+            result.add(" ".join(words[start : start + size]))
+    return result
+
+
+def minhash(shingle_set: Set[str], num_perm: int) -> Tuple[int, ...]:
+    """MinHash signature of a non-empty set of shingles"""
+    unpack = struct.Struct(f"<{num_perm}I").unpack
+    rows = [
+        unpack(hashlib.shake_128(shingle.encode("utf-8")).digest(4 * num_perm))
+        for shingle in shingle_set
+    ]
+    return tuple(map(min, zip(*rows)))
+
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Bands and rows per band for a similarity threshold
+
+    Two sets with Jaccard similarity s share a bucket in at least one band
+    with probability 1 - (1 - s**rows)**bands. The steepest part of that
+    curve, at (1 / bands)**(1 / rows), is placed at no more than 0.8 times
+    the threshold so that pairs just above it are almost always candidates;
+    among those choices the one with the most rows keeps the fewest
+    dissimilar candidates.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= 0.8 * threshold:
+            best = (bands, rows)
+    return best
+
+
+class OverlapIndex:
+    """MinHash LSH index that reports pairs of similar shingle sets"""
+
+    def __init__(self, threshold: float, num_perm: int = 128):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Similarity threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        self.sets: List[Set[str]] = []
+        self.buckets: List[Dict[Tuple[int, ...], List[int]]] = [
+            {} for _ in range(self.bands)
+        ]
+
+    def add(self, shingle_set: Set[str], signature: Tuple[int, ...] = None) -> int:
+        """Index a shingle set and return its number; empty sets never match
+
+        signature is the set's MinHash with num_perm hashes, if it was
+        already computed elsewhere, such as in a worker process.
+        """
+        number = len(self.sets)
+        self.sets.append(shingle_set)
+        if shingle_set:
+            if signature is None:
+                signature = minhash(shingle_set, self.num_perm)
+            for band, buckets in enumerate(self.buckets):
+                start = band * self.rows
+                buckets.setdefault(signature[start : start + self.rows], []).append(number)
+        return number
+
+    def pairs(self) -> List[Tuple[int, int, float]]:
+        """(first, second, Jaccard similarity) of every pair over the threshold"""
+        candidates = set()
+        for buckets in self.buckets:
+            for members in buckets.values():
+                if len(members) > 1:
+                    candidates.update(combinations(members, 2))
+
+        found = []
+        for first, second in sorted(candidates):
+            a, b = self.sets[first], self.sets[second]
+            similarity = len(a & b) / len(a | b)
+            if similarity >= self.threshold:
+                found.append((first, second, similarity))
+        return found
+
+
+def _skill_signatures(skill_path: str, config_path: str = None) -> Dict[str, Any]:
+    """Shingles and signatures of one skill; module level so it can run in a
+    worker process"""
+    rules = load_rules(config_path)
+    try:
+        document = SkillDocument(Path(skill_path) / "SKILL.md")
+        frontmatter = document.load_frontmatter() or {}
+        name = frontmatter.get("name")
+        description = frontmatter.get("description")
+        if not isinstance(description, str):
+            description = ""
+        phrases = trigger_phrases(description, document.iter_body_lines(), rules)
+    except (OSError, UnicodeDecodeError) as e:
+        return {"path": skill_path, "error": str(e)}
+
+    entry = {
+        "name": name if isinstance(name, str) else Path(skill_path).name,
+        "path": skill_path,
+    }
+    for kind, texts in (("description", [description]), ("triggers", phrases)):
+        shingle_set = shingles(texts, rules.overlap_shingle_size, rules)
+        signature = minhash(shingle_set, rules.overlap_num_perm) if shingle_set else None
+        entry[kind] = (shingle_set, signature)
+    return entry
+
+
+def _signatures_chunk(skill_paths: List[str], config_path: str = None) -> List[Dict]:
+    """Shingle a batch of skills in one worker task"""
+    return [_skill_signatures(skill_path, config_path) for skill_path in skill_paths]
+
+
+def find_overlaps(
+    skill_paths: List[str],
+    config_path: str = None,
+    description_threshold: float = None,
+    trigger_threshold: float = None,
+    workers: int = None,
+) -> Dict[str, Any]:
+    """Pairs of skills with near-duplicate descriptions or colliding triggers
+
+    Thresholds default to the "overlap" settings of the skill config.
+    Skills are shingled and signed in a process pool unless workers is 1;
+    unreadable ones are listed under "unreadable" and otherwise skipped.
+    Returns the compared skills and the overlapping pairs, most similar
+    first; each pair names its kind ("description" or "triggers"), the two
+    skills, their similarity and, for triggers, the shingles they share.
+    """
+    rules = load_rules(config_path)
+    if description_threshold is None:
+        description_threshold = rules.overlap_description_threshold
+    if trigger_threshold is None:
+        trigger_threshold = rules.overlap_trigger_threshold
+    indexes = {
+        "description": OverlapIndex(description_threshold, rules.overlap_num_perm),
+        "triggers": OverlapIndex(trigger_threshold, rules.overlap_num_perm),
+    }
+
+    skill_paths = [str(path) for path in skill_paths]
+    executor = None
+    if workers == 1 or len(skill_paths) <= 1:
+        entries = (_skill_signatures(path, config_path) for path in skill_paths)
+    else:
+        # Imported here, like in bulk validation, to keep cold start cheap
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(skill_paths) // ((workers or os.cpu_count() or 1) * 4))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        futures = [
+            executor.submit(_signatures_chunk, skill_paths[i : i + chunksize], config_path)
+            for i in range(0, len(skill_paths), chunksize)
+        ]
+        entries = (entry for future in futures for entry in future.result())
+
+    skills = []
+    unreadable = []
+    try:
+        for entry in entries:
+            if "error" in entry:
+                unreadable.append(entry)
+                continue
+            skills.append({"name": entry["name"], "path": entry["path"]})
+            for kind, index in indexes.items():
+                index.add(*entry[kind])
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    pairs = []
+    for kind, index in indexes.items():
+        for first, second, similarity in index.pairs():
+            pair = {
+                "kind": kind,
+                "skills": [skills[first], skills[second]],
+                "similarity": round(similarity, 3),
+            }
+            if kind == "triggers":
+                pair["shared"] = sorted(index.sets[first] & index.sets[second])
+            pairs.append(pair)
+    pairs.sort(
+        key=lambda pair: (
+            -pair["similarity"],
+            pair["kind"],
+            [skill["path"] for skill in pair["skills"]],
+        )
+    )
+
+    return {"skills": skills, "pairs": pairs, "unreadable": unreadable}
@@ -0,0 +1,243 @@
+"""
+Registry of installed OpenCode skills
+
+Keeps a compact on-disk index of every skill's frontmatter plus an inverted
+index from description terms to skills, so listing skills or finding the one
+that matches a request is a few dictionary lookups instead of a walk over
+every skill directory.
+"""
+
+import json
+import math
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .discovery import find_skill_dirs
+from .cache import DEFAULT_CACHE_DIR
+from .document import SkillDocument
+from .resolver import get_resolver, scope_of_path
+from .rules import RuleSet, load_rules
+
+# Bump whenever the index layout or term extraction changes
+INDEX_VERSION = "2"
+
+_TERM_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.-][a-z0-9+#]+)*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in into is it its of on or "
+    "that the this to with you your need needs want wants".split()
+)
+
+
+class SkillRegistry:
+    """Incrementally updated index of skills and their description terms
+
+    Each skill is keyed by its resolved directory and stores name, scope,
+    path, the mtime and size of SKILL.md, and description. Terms come from
+    the name and description; the configured trigger_keywords ("use when
+    ...") are boilerplate every description has, so they are not indexed
+    themselves but the clause they introduce counts double, since that is
+    where a description says when the skill applies.
+    """
+
+    FILENAME = "index.json"
+    # Same racy-mtime guard as the validation cache
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, cache_dir: Path = None, rules: RuleSet = None):
+        self.index_file = Path(cache_dir or DEFAULT_CACHE_DIR) / self.FILENAME
+        self.rules = rules or load_rules()
+        # Terms depend on the trigger keywords in the config
+        self.version = f"{INDEX_VERSION}:{self.rules.digest}"
+        self._trigger_re = re.compile(
+            rf"\b(?:{self.rules.trigger_re.pattern})\b", re.IGNORECASE
+        )
+        self.skills: Dict[str, Dict[str, Any]] = {}
+        # term -> {skill key: weight}
+        self.terms: Dict[str, Dict[str, int]] = {}
+        self.dirty = False
+        self._by_name = None
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get("version") == self.version:
+            self.skills = data.get("skills", {})
+            self.terms = data.get("terms", {})
+        else:
+            self.dirty = True
+
+    def save(self):
+        """Write the index atomically if it changed"""
+        if not self.dirty:
+            return
+
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": self.version, "skills": self.skills, "terms": self.terms},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_file, self.index_file)
+        self.dirty = False
+
+    def update(self, roots: Iterable[str] = None) -> Dict[str, int]:
+        """Bring the index up to date with the skills under roots
+
+        roots default to the project and global skill directories of the
+        shared resolver. Only skills whose SKILL.md changed since the last update are parsed
+        again; skills that disappeared from the roots are dropped. Returns
+        counts of added, updated, removed and unchanged skills.
+        """
+        if roots is None:
+            roots = [root.path for root in get_resolver().roots]
+        roots = [Path(root) for root in roots]
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        seen = set()
+
+        for root in roots:
+            if not root.is_dir():
+                continue
+            for skill_dir in find_skill_dirs(root):
+                key = str(skill_dir.resolve())
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                try:
+                    st = os.stat(skill_dir / "SKILL.md")
+                except OSError:
+                    continue
+                stats = [st.st_mtime_ns, st.st_size]
+                entry = self.skills.get(key)
+                if entry is not None and entry["stats"] == stats:
+                    counts["unchanged"] += 1
+                    continue
+
+                counts["updated" if entry is not None else "added"] += 1
+                self._remove(key)
+                self._add(key, skill_dir, stats)
+
+        # Only forget skills below the roots that were scanned
+        scanned = [str(root.resolve()) + os.sep for root in roots]
+        for key in list(self.skills):
+            if key not in seen and any(key.startswith(prefix) for prefix in scanned):
+                self._remove(key)
+                counts["removed"] += 1
+
+        return counts
+
+    def _add(self, key: str, skill_dir: Path, stats: List[int]):
+        frontmatter = read_frontmatter(skill_dir / "SKILL.md") or {}
+        # A SKILL.md written within the racy window may change again without
+        # its mtime moving, so it is parsed again on the next update
+        racy = stats[0] >= time.time_ns() - self.RACY_WINDOW_NS
+        name = frontmatter.get("name")
+        description = frontmatter.get("description")
+        scope = frontmatter.get("scope")
+        entry = {
+            "name": name if isinstance(name, str) else skill_dir.name,
+            # Where a skill is installed decides its scope over what it claims
+            "scope": scope_of_path(skill_dir)
+            or (scope if isinstance(scope, str) else "project"),
+            "path": key,
+            "stats": None if racy else stats,
+            "mtime": stats[0] / 1e9,
+            "description": description if isinstance(description, str) else "",
+        }
+        self.skills[key] = entry
+        for term, weight in self._extract_terms(entry).items():
+            self.terms.setdefault(term, {})[key] = weight
+        self._by_name = None
+        self.dirty = True
+
+    def _remove(self, key: str):
+        entry = self.skills.pop(key, None)
+        if entry is None:
+            return
+        for term in self._extract_terms(entry):
+            postings = self.terms.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self.terms[term]
+        self._by_name = None
+        self.dirty = True
+
+    def _extract_terms(self, entry: Dict[str, Any]) -> Dict[str, int]:
+        """Term -> weight for a skill"""
+        terms = {}
+        for term in tokenize(entry["name"].replace("-", " ")):
+            terms[term] = 2
+        description = entry["description"]
+        for term in self._tokens(description):
+            terms.setdefault(term, 1)
+
+        # The clause after a trigger keyword says when the skill applies
+        for match in self._trigger_re.finditer(description):
+            clause = re.split(r"[.;\n]", description[match.end():], 1)[0]
+            for term in self._tokens(clause):
+                terms[term] = 2
+        return terms
+
+    def _tokens(self, text: str) -> List[str]:
+        return [term for term in tokenize(text) if not self._trigger_re.fullmatch(term)]
+
+    def lookup(self, name: str) -> List[Dict[str, Any]]:
+        """Every indexed skill with this name, project skills first"""
+        if self._by_name is None:
+            by_name = {}
+            for entry in self.skills.values():
+                by_name.setdefault(entry["name"], []).append(entry)
+            for entries in by_name.values():
+                entries.sort(
+                    key=lambda entry: (entry["scope"] != "project", entry["path"])
+                )
+            self._by_name = by_name
+        return self._by_name.get(name, [])
+
+    def search(self, text: str, limit: int = 5) -> List[Tuple[float, Dict[str, Any]]]:
+        """Skills whose name and description best match text, best first
+
+        Scores sum the weight of every matching term scaled by how rare the
+        term is across the index.
+        """
+        total = len(self.skills) or 1
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(text)):
+            postings = self.terms.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + total / len(postings))
+            for key, weight in postings.items():
+                scores[key] = scores.get(key, 0.0) + weight * idf
+
+        best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(round(score, 3), self.skills[key]) for key, score in best]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase terms of text without stopwords"""
+    return [
+        term
+        for term in _TERM_RE.findall(text.lower())
+        if len(term) > 1 and term not in _STOPWORDS
+    ]
+
+
+def read_frontmatter(skill_md: Path) -> Dict[str, Any]:
+    """Frontmatter of a SKILL.md as a dict, or None if it has none or is invalid"""
+    try:
+        document = SkillDocument(skill_md)
+    except (OSError, UnicodeDecodeError):
+        return None
+    return document.load_frontmatter()
@@ -0,0 +1,114 @@
+"""
+Output formats for skill validation results
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .validator import VALIDATOR_VERSION
+
+
+def print_result(result: Dict[str, Any], label: str = None):
+    """Print a validation result in the human readable format"""
+    suffix = f": {label}" if label else ""
+    kind = result.get("kind", "skill").capitalize()
+    if not result["valid"]:
+        print(f"❌ {kind} validation FAILED{suffix}")
+        for error in result["errors"]:
+            print(f"  ERROR: {error}")
+    else:
+        print(f"✅ {kind} validation PASSED{suffix}")
+
+    for warning in result["warnings"]:
+        print(f"  ⚠️  WARNING: {warning}")
+
+    for info in result["info"]:
+        print(f"  ℹ️  INFO: {info}")
+
+
+def print_profile(
+    results: List[Dict[str, Any]], elapsed: float, top: int = 10, file=None
+):
+    """Print a per-check breakdown and the slowest skills of a run"""
+    file = file or sys.stdout
+    fresh = [result for result in results if not result.get("cached")]
+
+    checks = {}
+    for result in fresh:
+        for span in result["profile"]:
+            stats = checks.setdefault(span["check"], [0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += span["duration_ms"]
+            stats[2] += span["bytes_read"]
+
+    print(
+        f"\n⏱️  Profile: {len(results)} skills ({len(results) - len(fresh)} cached) "
+        f"in {elapsed:.3f}s",
+        file=file,
+    )
+    print(f"  {'check':<20} {'calls':>7} {'total ms':>11} {'mean ms':>9} {'bytes':>12}", file=file)
+    for check, (calls, total_ms, total_bytes) in sorted(
+        checks.items(), key=lambda item: item[1][1], reverse=True
+    ):
+        print(
+            f"  {check:<20} {calls:>7} {total_ms:>11.2f} {total_ms / calls:>9.3f} {total_bytes:>12}",
+            file=file,
+        )
+    print("  (script spans are nested inside optional_structure)", file=file)
+
+    slowest = sorted(fresh, key=lambda result: result["duration_ms"], reverse=True)
+    if slowest[:top]:
+        print(f"\n  Slowest {min(top, len(slowest))} skills:", file=file)
+    for result in slowest[:top]:
+        worst = max(result["profile"], key=lambda span: span["duration_ms"])
+        print(
+            f"  {result['duration_ms']:>9.2f} ms  {result['skill_path']} "
+            f"(slowest check: {worst['check']}, {worst['duration_ms']:.2f} ms)",
+            file=file,
+        )
+
+
+def sarif_report(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert validation results into a SARIF 2.1.0 log"""
+    levels = {"error": "error", "warning": "warning", "info": "note"}
+    rule_ids = []
+    sarif_results = []
+    for result in results:
+        for diagnostic in result["diagnostics"]:
+            if diagnostic["rule"] not in rule_ids:
+                rule_ids.append(diagnostic["rule"])
+
+            path = Path(result["skill_path"])
+            if diagnostic["file"]:
+                path = path / diagnostic["file"]
+            location = {"artifactLocation": {"uri": Path(os.path.relpath(path)).as_posix()}}
+            if diagnostic["line"]:
+                location["region"] = {"startLine": diagnostic["line"]}
+
+            sarif_results.append(
+                {
+                    "ruleId": diagnostic["rule"],
+                    "level": levels[diagnostic["severity"]],
+                    "message": {"text": diagnostic["message"]},
+                    "locations": [{"physicalLocation": location}],
+                }
+            )
+
+    return {
+        "version": "2.1.0",
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "opencode-skill-validate",
+                        "version": VALIDATOR_VERSION,
+                        "rules": [{"id": rule_id} for rule_id in rule_ids],
+                    }
+                },
+                "results": sarif_results,
+            }
+        ],
+    }
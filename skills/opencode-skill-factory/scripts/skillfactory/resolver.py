@@ -0,0 +1,151 @@
+"""
+Scope-aware resolution of installed OpenCode skills
+
+Project skills live in .opencode/skill directories from the working
+directory up to the top of its git worktree, the nearest one first; global
+skills live in ~/.config/opencode/skill. A project skill overrides a global
+skill of the same name, and a nearer project directory overrides a farther
+one. The merged view is computed once and reused until one of the skill
+directories changes.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+PROJECT_SKILL_DIR = Path(".opencode") / "skill"
+GLOBAL_SKILL_DIR = Path(".config") / "opencode" / "skill"
+
+
+class SkillRoot(NamedTuple):
+    scope: str
+    path: Path
+
+
+class ResolvedSkill(NamedTuple):
+    name: str
+    scope: str
+    path: Path
+    # Skills of the same name that this one overrides, highest precedence first
+    shadows: Tuple[Path, ...] = ()
+
+
+def discover_roots(cwd: Path = None, home: Path = None) -> List[SkillRoot]:
+    """Skill directories in precedence order, whether or not they exist yet
+
+    The first root is always the project directory in cwd, so new project
+    skills go there; the global directory comes last.
+    """
+    cwd = Path(cwd or Path.cwd()).resolve()
+    home = Path(home or Path.home())
+    roots = []
+    for directory in (cwd, *cwd.parents):
+        roots.append(SkillRoot("project", directory / PROJECT_SKILL_DIR))
+        # Stop at the top of the worktree, like OpenCode itself
+        if (directory / ".git").exists():
+            break
+    else:
+        # Not inside a worktree: only the working directory counts
+        roots = roots[:1]
+    roots.append(SkillRoot("global", home / GLOBAL_SKILL_DIR))
+    return roots
+
+
+class SkillResolver:
+    """Merged, memoized view of the skills installed in every skill root
+
+    The view is keyed by skill directory name, which the validator requires
+    to match the frontmatter name. It is rebuilt only when the mtime of a
+    root changes, which happens whenever a skill directory is added,
+    removed or renamed in it.
+    """
+
+    def __init__(self, cwd: Path = None, home: Path = None):
+        self.roots = discover_roots(cwd, home)
+        self._signature = None
+        self._skills: Dict[str, ResolvedSkill] = {}
+
+    def _root_signature(self) -> Tuple[Optional[int], ...]:
+        signature = []
+        for root in self.roots:
+            try:
+                signature.append(os.stat(root.path).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def skills(self) -> Dict[str, ResolvedSkill]:
+        """Name -> winning skill, rescanning only roots that changed"""
+        signature = self._root_signature()
+        if signature == self._signature:
+            return self._skills
+
+        found: Dict[str, List[Tuple[str, Path]]] = {}
+        for root, mtime in zip(self.roots, signature):
+            if mtime is None:
+                continue
+            try:
+                with os.scandir(root.path) as it:
+                    entries = sorted(
+                        (entry.name, Path(entry.path))
+                        for entry in it
+                        if entry.is_dir() and not entry.name.startswith(".")
+                    )
+            except OSError:
+                continue
+            for name, path in entries:
+                if (path / "SKILL.md").is_file():
+                    found.setdefault(name, []).append((root.scope, path))
+
+        self._skills = {}
+        for name, candidates in found.items():
+            (scope, path), *shadowed = candidates
+            self._skills[name] = ResolvedSkill(
+                name, scope, path, tuple(path for _, path in shadowed)
+            )
+        self._signature = signature
+        return self._skills
+
+    def resolve(self, name: str) -> Optional[ResolvedSkill]:
+        """The skill OpenCode loads for a name, or None"""
+        return self.skills().get(name)
+
+    def collisions(self) -> Dict[str, ResolvedSkill]:
+        """Skills that override at least one other skill of the same name"""
+        return {name: skill for name, skill in self.skills().items() if skill.shadows}
+
+    def root_for(self, scope: str) -> Path:
+        """Directory new skills of a scope are created in"""
+        if scope == "global":
+            return self.roots[-1].path
+        return self.roots[0].path
+
+    def path_for(self, name: str, scope: str) -> Path:
+        """Install location of a new skill"""
+        return self.root_for(scope) / name
+
+
+def scope_of_path(skill_path: Path, home: Path = None) -> Optional[str]:
+    """Scope implied by where a skill is installed, or None elsewhere
+
+    Only the shape of the path is used, so the answer does not depend on the
+    working directory.
+    """
+    parent = Path(skill_path).resolve().parent
+    if parent == (Path(home or Path.home()) / GLOBAL_SKILL_DIR).resolve():
+        return "global"
+    if parent.parts[-2:] == PROJECT_SKILL_DIR.parts:
+        return "project"
+    return None
+
+
+_resolvers: Dict[Tuple[str, str], SkillResolver] = {}
+
+
+def get_resolver(cwd: Path = None, home: Path = None) -> SkillResolver:
+    """Shared resolver for a working directory and home"""
+    key = (str(Path(cwd or Path.cwd()).resolve()), str(home or Path.home()))
+    resolver = _resolvers.get(key)
+    if resolver is None:
+        resolver = _resolvers[key] = SkillResolver(cwd, home)
+    return resolver
@@ -0,0 +1,194 @@
+"""
+Validation rules for OpenCode skills
+
+Loads assets/skill-config.json once per process, precompiles its patterns and
+keeps the table of frontmatter rules that SkillValidator runs.
+"""
+
+import hashlib
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple
+
+DEFAULT_CONFIG = Path(__file__).resolve().parents[2] / "assets" / "skill-config.json"
+
+
+class Rule(NamedTuple):
+    id: str
+    field: str
+    check: Callable[["SkillValidator", Any], None]
+
+
+# Frontmatter rules, run in registration order for every field that is present
+FRONTMATTER_RULES: List[Rule] = []
+# The same for agent definitions; see skillfactory.agent
+AGENT_RULES: List[Rule] = []
+
+
+def frontmatter_rule(rule_id: str, field: str):
+    """Register a check for a frontmatter field
+
+    The check is called as check(validator, value) and reports findings with
+    validator.report(); messages appended straight to the validator's errors,
+    warnings or info lists are attributed to rule_id. Modules listed under
+    "rule_modules" in the skill config are imported when the config is loaded,
+    so organisations can add rules without editing this file.
+    """
+
+    def register(check):
+        FRONTMATTER_RULES.append(Rule(rule_id, field, check))
+        return check
+
+    return register
+
+
+def agent_rule(rule_id: str, field: str):
+    """Register a check for an agent frontmatter field, like frontmatter_rule"""
+
+    def register(check):
+        AGENT_RULES.append(Rule(rule_id, field, check))
+        return check
+
+    return register
+
+
+class RuleSet:
+    """Validation settings from skill-config.json, compiled once per process"""
+
+    def __init__(self, config: Dict[str, Any]):
+        defaults = config.get("skill_defaults", {})
+        rules = config.get("validation_rules", {})
+
+        self.name_re = re.compile(rules.get("name_pattern", r"^[a-z0-9]+(-[a-z0-9]+)*$"))
+        self.name_max_length = defaults.get("name_max_length", 64)
+        self.description_min_length = defaults.get("description_min_length", 20)
+        self.description_max_length = defaults.get("description_max_length", 1024)
+        self.required_frontmatter = tuple(
+            rules.get("required_frontmatter", ["name", "description"])
+        )
+        self.scopes = tuple(rules.get("scopes", ["project", "global"]))
+        self.common_licenses = tuple(
+            config.get(
+                "common_licenses", ["MIT", "Apache-2.0", "GPL-3.0", "BSD-3-Clause", "ISC"]
+            )
+        )
+        self.license_set = frozenset(self.common_licenses)
+
+        agents = config.get("agent_rules", {})
+        self.agent_required_frontmatter = tuple(
+            agents.get("required_frontmatter", ["description"])
+        )
+        self.agent_modes = tuple(agents.get("modes", ["subagent", "primary", "all"]))
+        self.agent_tools = frozenset(
+            agents.get(
+                "tools",
+                ["bash", "edit", "write", "read", "grep", "glob", "list", "patch",
+                 "todowrite", "todoread", "webfetch", "skill"],
+            )
+        )
+        # Permission -> the tools it governs
+        self.agent_permissions = {
+            key: tuple(tools)
+            for key, tools in agents.get(
+                "permissions",
+                {
+                    "edit": ["edit", "write", "patch"],
+                    "bash": ["bash"],
+                    "webfetch": ["webfetch"],
+                    "doom_loop": [],
+                    "external_directory": [],
+                },
+            ).items()
+        }
+        self.permission_levels = tuple(
+            agents.get("permission_levels", ["allow", "ask", "deny"])
+        )
+        self.temperature_range = tuple(agents.get("temperature_range", [0.0, 1.0]))
+        self.top_p_range = tuple(agents.get("top_p_range", [0.0, 1.0]))
+
+        # Estimated tokens; see skillfactory.budget
+        budget = config.get("token_budget", {})
+        self.section_max_tokens = budget.get("section_max_tokens", 1000)
+        self.eager_max_tokens = budget.get("eager_max_tokens", 5000)
+
+        # Jaccard similarities; see skillfactory.overlap
+        overlap = config.get("overlap", {})
+        self.overlap_description_threshold = overlap.get("description_threshold", 0.5)
+        self.overlap_trigger_threshold = overlap.get("trigger_threshold", 0.4)
+        self.overlap_shingle_size = overlap.get("shingle_size", 2)
+        self.overlap_num_perm = overlap.get("num_perm", 128)
+
+        # One alternation instead of a substring test per keyword
+        keywords = config.get(
+            "trigger_keywords", ["when", "use", "trigger", "invoke", "call", "apply"]
+        )
+        self.trigger_re = re.compile(
+            "|".join(re.escape(word) for word in sorted(keywords, key=len, reverse=True)),
+            re.IGNORECASE,
+        )
+
+        # Declarative rules: {"id", "field", "pattern", "message", "severity"}
+        self.custom_rules = [
+            self._compile_custom_rule(spec) for spec in config.get("custom_rules", [])
+        ]
+
+        digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode())
+        if config.get("rule_modules"):
+            import importlib
+
+            for name in config["rule_modules"]:
+                module = importlib.import_module(name)
+                # Editing a rule module must invalidate cached results too
+                digest.update(name.encode())
+                digest.update(self._module_source_hash(module))
+        self.digest = digest.hexdigest()[:16]
+
+    @staticmethod
+    def _module_source_hash(module) -> bytes:
+        """Hash of a module's source file, or of its name if it has none"""
+        path = getattr(module, "__file__", None)
+        if path:
+            try:
+                with open(path, "rb") as f:
+                    return hashlib.sha256(f.read()).digest()
+            except OSError:
+                pass
+        return module.__name__.encode()
+
+    @staticmethod
+    def _compile_custom_rule(spec: Dict[str, Any]) -> Rule:
+        pattern = re.compile(spec["pattern"])
+        severity = spec.get("severity", "warning")
+        if severity not in ("error", "warning", "info"):
+            raise ValueError(f"Unknown severity '{severity}' in rule {spec['id']}")
+        message = spec.get("message", f"{spec['field']} does not match {spec['pattern']}")
+
+        def check(validator: "SkillValidator", value: Any):
+            if not isinstance(value, str) or not pattern.search(value):
+                validator.report(severity, spec["id"], message)
+
+        return Rule(spec["id"], spec["field"], check)
+
+    @property
+    def rules(self) -> List[Rule]:
+        return FRONTMATTER_RULES + self.custom_rules
+
+    @property
+    def agent_rules(self) -> List[Rule]:
+        return AGENT_RULES
+
+
+@lru_cache(maxsize=None)
+def load_rules(config_path: str = None) -> RuleSet:
+    """Load and compile the skill config; built-in defaults if it is missing"""
+    path = Path(config_path) if config_path else DEFAULT_CONFIG
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        if config_path:
+            raise
+        config = {}
+    return RuleSet(config)
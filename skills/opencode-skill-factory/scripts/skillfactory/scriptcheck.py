@@ -0,0 +1,173 @@
+"""
+Checks of the scripts shipped with a skill
+
+Python scripts are compiled and shell scripts are run through shellcheck
+when it is on PATH. Both depend only on the script's content, so their
+diagnostics are cached under the content hash and shared by every skill
+and worker process.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Bump whenever a check changes so cached diagnostics are not reused
+SCRIPT_CHECK_VERSION = "1"
+
+# (severity, rule id, message, line)
+Diagnostic = Tuple[str, str, str, Optional[int]]
+
+# shellcheck is optional, so its findings never make a skill invalid
+_SHELLCHECK_SEVERITY = {
+    "error": "warning",
+    "warning": "warning",
+    "info": "info",
+    "style": "info",
+}
+
+
+@lru_cache(maxsize=None)
+def shellcheck_path() -> Optional[str]:
+    """Path of the shellcheck executable, or None if it is not installed"""
+    return shutil.which("shellcheck")
+
+
+def tools_signature() -> str:
+    """Identifies the external checkers available, for cache keys"""
+    tool = shellcheck_path()
+    if tool is None:
+        return "no-shellcheck"
+    try:
+        st = os.stat(tool)
+    except OSError:
+        return tool
+    # A reinstalled shellcheck may report differently
+    return f"{tool}:{st.st_mtime_ns}:{st.st_size}"
+
+
+class ScriptCache:
+    """Content-addressed diagnostics, one small file per script content
+
+    Entries never go stale, so worker processes read and write them
+    independently without any coordination. Every edit to a script adds an
+    entry, though, so prune() drops the least recently used ones beyond
+    max_entries; a hit touches its file, so the mtime is its last use.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = 20000):
+        self.root = Path(cache_dir) / "scripts"
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(kind: str, name: str, data: bytes) -> str:
+        # Messages mention the script name, so it is part of the key
+        digest = hashlib.sha256(
+            f"{SCRIPT_CHECK_VERSION}\0{kind}\0{name}\0{sys.version_info[:2]}\0".encode()
+        )
+        if kind == "shellcheck":
+            digest.update(tools_signature().encode())
+        digest.update(b"\0" + data)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[Diagnostic]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                diagnostics = [tuple(diagnostic) for diagnostic in json.load(f)]
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return diagnostics
+
+    def put(self, key: str, diagnostics: List[Diagnostic]):
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(diagnostics, f)
+            os.replace(tmp_file, path)
+        except OSError:
+            # The cache is an optimization; a read-only tree still validates
+            pass
+
+    def prune(self):
+        """Delete the least recently used entries beyond max_entries
+
+        Run once per validation run, after the workers are done; an entry
+        deleted under a concurrent run is just checked again.
+        """
+        entries = []
+        try:
+            shards = list(os.scandir(self.root))
+        except OSError:
+            return
+        for shard in shards:
+            try:
+                with os.scandir(shard.path) as it:
+                    for entry in it:
+                        try:
+                            entries.append((entry.stat().st_mtime_ns, entry.path))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort(reverse=True)
+        for _, path in entries[self.max_entries :]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def check_python(name: str, data: bytes) -> List[Diagnostic]:
+    """Compile a Python script"""
+    try:
+        compile(data.decode("utf-8"), name, "exec")
+    except SyntaxError as e:
+        return [("error", "script.syntax-error", f"Syntax error in {name}: {e}", e.lineno)]
+    except (UnicodeDecodeError, ValueError) as e:
+        return [("error", "script.syntax-error", f"Could not compile {name}: {e}", None)]
+    return []
+
+
+def check_shell(name: str, path: Path) -> List[Diagnostic]:
+    """Run shellcheck on a shell script"""
+    import subprocess
+
+    try:
+        completed = subprocess.run(
+            [shellcheck_path(), "--format=json1", str(path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=60,
+            check=False,
+        )
+        comments = json.loads(completed.stdout or b"{}").get("comments", [])
+    except (OSError, ValueError, subprocess.SubprocessError) as e:
+        message = f"Could not run shellcheck on {name}: {e}"
+        return [("warning", "script.shellcheck-failed", message, None)]
+
+    return [
+        (
+            _SHELLCHECK_SEVERITY.get(comment.get("level"), "info"),
+            "script.shellcheck",
+            f"{name}: SC{comment.get('code')}: {comment.get('message')}",
+            comment.get("line"),
+        )
+        for comment in comments
+    ]
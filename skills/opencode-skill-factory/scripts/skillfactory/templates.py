@@ -0,0 +1,129 @@
+"""
+Templates for generated skill and agent files
+
+Templates are plain files with {{field}} placeholders. Each one is compiled
+once into a list of literal chunks and field names, so rendering is a single
+join no matter how many skills a batch generates.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+DEFAULT_TEMPLATE_DIR = Path(__file__).resolve().parents[2] / "assets"
+
+# Template name -> file name looked up in each template directory
+TEMPLATE_FILES = {
+    "skill": "skill-template.md",
+    "examples": "examples-template.md",
+    "troubleshooting": "troubleshooting-template.md",
+    "validate-script": "validate-script-template.py",
+    "agent": "agent-template.md",
+}
+
+PLACEHOLDER_RE = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+# Fields provided by skill_context()
+CONTEXT_FIELDS = frozenset(
+    {
+        "skill_name",
+        "skill_title",
+        "skill_description",
+        "skill_license",
+        "skill_scope",
+        "skill_purpose",
+    }
+)
+# Fields provided for agent files; see skillfactory.agent.render_agent
+AGENT_CONTEXT_FIELDS = frozenset(
+    {
+        "agent_name",
+        "agent_title",
+        "agent_description",
+        "agent_purpose",
+        "agent_frontmatter",
+    }
+)
+
+
+class Template:
+    """Template compiled into alternating literal text and field names"""
+
+    def __init__(self, text: str, name: str = "<string>"):
+        self.name = name
+        # re.split with one group yields [literal, field, literal, field, ...]
+        self._parts = PLACEHOLDER_RE.split(text)
+        self.fields = self._parts[1::2]
+
+    def render(self, context: Dict[str, Any]) -> str:
+        parts = self._parts.copy()
+        try:
+            parts[1::2] = [str(context[field]) for field in self.fields]
+        except KeyError as e:
+            raise ValueError(f"{self.name}: no value for {{{{{e.args[0]}}}}}") from None
+        return "".join(parts)
+
+
+class TemplateSet:
+    """Compiled templates, looked up in user directories before the built-in ones"""
+
+    def __init__(self, template_dirs: Iterable[str] = ()):
+        self.search_path = [Path(d).expanduser() for d in template_dirs]
+        self.search_path.append(DEFAULT_TEMPLATE_DIR)
+        self._compiled: Dict[str, Template] = {}
+
+    def find(self, name: str) -> Path:
+        """Path of the file that provides a template"""
+        file_name = TEMPLATE_FILES.get(name)
+        if file_name is None:
+            raise ValueError(f"Unknown template: {name}")
+        for directory in self.search_path:
+            path = directory / file_name
+            if path.is_file():
+                return path
+        searched = ", ".join(map(str, self.search_path))
+        raise ValueError(f"Template {file_name} not found in {searched}")
+
+    def get(self, name: str) -> Template:
+        template = self._compiled.get(name)
+        if template is None:
+            path = self.find(name)
+            template = Template(path.read_text(encoding="utf-8"), str(path))
+            # Catch typos in user templates before anything is written
+            fields = AGENT_CONTEXT_FIELDS if name == "agent" else CONTEXT_FIELDS
+            unknown = sorted(set(template.fields) - fields)
+            if unknown:
+                raise ValueError(
+                    f"{path}: unknown placeholder(s) {', '.join(unknown)}"
+                )
+            self._compiled[name] = template
+        return template
+
+    def compile_all(self) -> List[Template]:
+        """Compile every template up front, e.g. before a batch fans out to threads"""
+        return [self.get(name) for name in TEMPLATE_FILES]
+
+    def render(self, name: str, context: Dict[str, Any]) -> str:
+        return self.get(name).render(context)
+
+
+@lru_cache(maxsize=None)
+def load_templates(template_dirs: tuple = ()) -> TemplateSet:
+    """Shared template set for a tuple of user template directories"""
+    return TemplateSet(template_dirs)
+
+
+def skill_context(skill_info: Dict[str, Any]) -> Dict[str, str]:
+    """Template fields for a skill"""
+    name = skill_info["name"]
+    return {
+        "skill_name": name,
+        "skill_title": name.replace("-", " ").title(),
+        "skill_description": skill_info["description"],
+        "skill_license": skill_info["license"],
+        "skill_scope": skill_info["scope"],
+        "skill_purpose": skill_info.get(
+            "purpose", "[Describe what this skill accomplishes in 1-2 sentences]"
+        ),
+    }
@@ -0,0 +1,204 @@
+"""
+Transactional writes of generated skills
+
+Each skill is written into a staging directory next to its final location
+and renamed into place only after every file is on disk, so an interrupted
+or failed generation never leaves a half-built skill behind. Single-file
+outputs, like agent definitions, are staged the same way as a file.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .discovery import STAGING_SUFFIX
+
+
+def _fsync_path(path: Path, directory: bool = False):
+    """fsync a file or directory, ignoring platforms that can't sync directories"""
+    flags = os.O_RDONLY
+    if directory:
+        flags |= getattr(os, "O_DIRECTORY", 0)
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        if directory:
+            return
+        raise
+    try:
+        os.fsync(fd)
+    except OSError:
+        if not directory:
+            raise
+    finally:
+        os.close(fd)
+
+
+def _remove(path: Path):
+    """Delete a staged or moved skill directory or file"""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class SkillTransaction:
+    """Stage any number of skills, then move all of them into place at once
+
+    Usage:
+        with SkillTransaction() as transaction:
+            transaction.stage(path, files)
+            transaction.commit()
+
+    Leaving the block without committing, or a failed commit, removes
+    everything that was staged and restores skills that were being replaced.
+    Fsyncs are grouped: all staged files are synced in one pass (in parallel
+    with sync_workers), then the renames happen, then each parent directory
+    is synced once.
+    """
+
+    def __init__(self, sync: bool = True, sync_workers: int = None):
+        self.sync = sync
+        self.sync_workers = sync_workers
+        # (staging directory, final path)
+        self.staged: List[Tuple[Path, Path]] = []
+        # Everything staged so far, for the grouped fsync
+        self._files: List[Path] = []
+        self._directories: Set[Path] = set()
+        self.committed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.committed:
+            self.rollback()
+        return False
+
+    def stage(
+        self,
+        target: Path,
+        files: Dict[str, str],
+        directories: Iterable[str] = (),
+        executable: Iterable[str] = (),
+    ) -> Path:
+        """Write a skill into a staging directory next to target
+
+        files maps paths relative to the skill to their content; directories
+        are created even when empty and executable files get mode 0755.
+        """
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Same parent directory as the target, so the final rename is atomic
+        staging = Path(
+            tempfile.mkdtemp(
+                prefix=f".{target.name}.", suffix=STAGING_SUFFIX, dir=target.parent
+            )
+        )
+        self.staged.append((staging, target))
+        os.chmod(staging, 0o755)
+
+        self._directories.add(staging)
+        for directory in directories:
+            (staging / directory).mkdir(parents=True, exist_ok=True)
+            self._directories.add(staging / directory)
+        for relative_path, content in files.items():
+            path = staging / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            self._files.append(path)
+            self._directories.add(path.parent)
+        for relative_path in executable:
+            os.chmod(staging / relative_path, 0o755)
+        return staging
+
+    def stage_file(self, target: Path, content: str) -> Path:
+        """Write a single file, such as an agent definition, next to target"""
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(
+            prefix=f".{target.name}.", suffix=STAGING_SUFFIX, dir=target.parent
+        )
+        staging = Path(name)
+        self.staged.append((staging, target))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.chmod(staging, 0o644)
+        self._files.append(staging)
+        return staging
+
+    def _sync_staged(self):
+        """Flush every staged file and directory to disk in one pass"""
+        jobs = [(path, False) for path in self._files]
+        jobs += [(path, True) for path in self._directories]
+
+        if self.sync_workers and self.sync_workers > 1 and len(jobs) > 1:
+            # fsync releases the GIL; on network filesystems the round trips
+            # overlap instead of adding up
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=self.sync_workers) as executor:
+                list(executor.map(lambda job: _fsync_path(*job), jobs))
+        else:
+            for path, directory in jobs:
+                _fsync_path(path, directory)
+
+    def commit(self):
+        """Move every staged skill and file into place, rolling all of them back
+        on failure"""
+        if self.sync:
+            self._sync_staged()
+
+        moved = []  # (final path, backup of the replaced skill or None)
+        try:
+            for staging, target in self.staged:
+                backup = None
+                if target.exists() or target.is_symlink():
+                    # A directory can't be renamed over a non-empty one, so
+                    # move the old skill aside until the commit succeeds
+                    backup = Path(
+                        tempfile.mkdtemp(
+                            prefix=f".{target.name}.old.",
+                            suffix=STAGING_SUFFIX,
+                            dir=target.parent,
+                        )
+                    )
+                    os.rmdir(backup)
+                    os.rename(target, backup)
+                try:
+                    os.rename(staging, target)
+                except OSError:
+                    if backup is not None:
+                        os.rename(backup, target)
+                    raise
+                moved.append((target, backup))
+        except BaseException:
+            for target, backup in reversed(moved):
+                _remove(target)
+                if backup is not None:
+                    os.rename(backup, target)
+            self.rollback()
+            raise
+
+        if self.sync:
+            for parent in {target.parent for _, target in self.staged}:
+                _fsync_path(parent, directory=True)
+
+        self.committed = True
+        for _, backup in moved:
+            if backup is not None:
+                _remove(backup)
+
+    def rollback(self):
+        """Remove everything staged that has not been moved into place"""
+        for staging, _ in self.staged:
+            _remove(staging)
+        self.staged = []
+        self._files = []
+        self._directories = set()
@@ -0,0 +1,92 @@
+"""
+File index of a skill directory
+
+One os.scandir walk records every file and directory of a skill, so link
+and structure checks are set lookups instead of a stat per question.
+"""
+
+import os
+import posixpath
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# Never part of a skill's content
+IGNORED_NAMES = {"__pycache__", "node_modules"}
+
+
+class SkillTree:
+    """Relative POSIX paths of every file and directory in a skill"""
+
+    def __init__(self):
+        self.files = set()
+        self.dirs = set()
+        # Number of entries directly inside each top-level directory
+        self.entry_counts: Dict[str, int] = {}
+
+    @classmethod
+    def scan(cls, skill_path: Path) -> "SkillTree":
+        tree = cls()
+        stack = [("", str(skill_path))]
+        while stack:
+            relative_dir, directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            if relative_dir and "/" not in relative_dir:
+                tree.entry_counts[relative_dir] = len(entries)
+
+            for entry in entries:
+                # Hidden files and caches are not shipped content
+                if entry.name.startswith(".") or entry.name in IGNORED_NAMES:
+                    continue
+                relative_path = posixpath.join(relative_dir, entry.name)
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    tree.dirs.add(relative_path)
+                    # Only the top-level directories (scripts/, references/,
+                    # assets/) may be symlinks; deeper ones could loop
+                    if not relative_dir or not entry.is_symlink():
+                        stack.append((relative_path, entry.path))
+                else:
+                    if entry.is_symlink():
+                        # A dangling link is not a file any check can read
+                        try:
+                            entry.stat()
+                        except OSError:
+                            continue
+                    tree.files.add(relative_path)
+        return tree
+
+    @classmethod
+    def from_paths(cls, relative_paths: Iterable[str]) -> "SkillTree":
+        """Tree of files that have not been written yet"""
+        tree = cls()
+        for relative_path in relative_paths:
+            tree.files.add(relative_path)
+            parent = posixpath.dirname(relative_path)
+            while parent:
+                tree.dirs.add(parent)
+                parent = posixpath.dirname(parent)
+        return tree
+
+    def resolve(self, source: str, target: str) -> Optional[str]:
+        """Path a link in source points to, or None if it leaves the skill"""
+        path = posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+        if path == ".":
+            return ""
+        if path == ".." or path.startswith("../"):
+            return None
+        return path
+
+    def __contains__(self, relative_path: str) -> bool:
+        # "" is the skill directory itself
+        return (
+            relative_path in self.files
+            or relative_path in self.dirs
+            or not relative_path
+        )
@@ -0,0 +1,776 @@
+"""
+Skill validator for OpenCode skills
+
+Validates skill structure, frontmatter, and content according to best practices.
+"""
+
+import posixpath
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from .budget import estimate_tokens, reference_name, section_label, section_tokens
+from .document import BodyIndex, SkillDocument, parse_simple_frontmatter, _load_yaml
+from .resolver import scope_of_path
+from .rules import Rule, RuleSet, frontmatter_rule, load_rules
+from .tree import SkillTree
+from .scriptcheck import ScriptCache, check_python, check_shell, shellcheck_path
+
+# Bump whenever a rule changes so cached results are invalidated
+VALIDATOR_VERSION = "10"
+
+# Callbacks receiving every timing span of freshly validated skills; see
+# add_span_hook
+SPAN_HOOKS: List[Callable[[Dict[str, Any]], None]] = []
+
+def add_span_hook(hook: Callable[[Dict[str, Any]], None]):
+    """Forward timing spans to hook, e.g. to export them to a tracing system
+
+    A span is a dict with skill_path, check, file, start (epoch seconds),
+    duration_ms and bytes_read. validate_many calls hooks in the calling
+    process once a skill's result arrives, so they also see spans recorded in
+    worker processes. Cached results produce no spans.
+    """
+    SPAN_HOOKS.append(hook)
+
+
+class SkillValidator:
+    # What a result describes, and the file frontmatter findings point at
+    KIND = "skill"
+    MAIN_FILE = "SKILL.md"
+
+    def __init__(
+        self,
+        skill_path: str,
+        rules: RuleSet = None,
+        script_cache: ScriptCache = None,
+        fix: bool = False,
+    ):
+        self.skill_path = Path(skill_path).resolve()
+        self.rules = rules or load_rules()
+        self.script_cache = script_cache
+        # Repair what can be repaired (executable bits) instead of reporting it
+        self.fix = fix
+        self.errors = []
+        self.warnings = []
+        self.info = []
+        self.diagnostics = []
+        self.profile = []
+        self.bytes_read = 0
+        self._field = None
+        # Rendered content by path relative to the skill; see validate_rendered
+        self.files: Dict[str, bytes] = None
+
+    def validate(self) -> Dict[str, Any]:
+        """Run all validations and return results"""
+        return self._run_checks(
+            [
+                ("structure", self._validate_structure),
+                ("skill_file", self._validate_skill_file),
+                ("frontmatter", self._validate_frontmatter),
+                ("content", self._validate_content),
+                ("optional_structure", self._validate_optional_structure),
+                ("links", self._validate_links),
+            ]
+        )
+
+    def validate_rendered(self, files: Dict[str, str]) -> Dict[str, Any]:
+        """Validate skill files that have been rendered but not written yet
+
+        files maps paths relative to the skill directory to their content.
+        Checks of the directory on disk (layout, file counts, executable
+        bits) are skipped; everything else runs on the in-memory content.
+        """
+        self.files = {
+            relative_path: content.encode("utf-8")
+            for relative_path, content in files.items()
+        }
+        self.tree = SkillTree.from_paths(self.files)
+        if "SKILL.md" not in self.files:
+            self.report(
+                "error", "structure.missing-skill-md", "Missing required SKILL.md file"
+            )
+        return self._run_checks(
+            [
+                ("skill_file", self._validate_skill_file),
+                ("frontmatter", self._validate_frontmatter),
+                ("content", self._validate_content),
+                ("scripts", self._validate_rendered_scripts),
+                ("links", self._validate_links),
+            ]
+        )
+
+    def _run_checks(self, checks) -> Dict[str, Any]:
+        started = time.perf_counter()
+        for name, check in checks:
+            with self._span(name):
+                check()
+
+        return {
+            "skill_path": str(self.skill_path),
+            "kind": self.KIND,
+            "valid": len(self.errors) == 0,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "info": self.info,
+            "diagnostics": self.diagnostics,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+            "profile": self.profile,
+        }
+
+    def _total_bytes_read(self) -> int:
+        document = getattr(self, "document", None)
+        return self.bytes_read + (document.bytes_read if document else 0)
+
+    @contextmanager
+    def _span(self, check: str, file: str = None):
+        """Record wall time and bytes read of a check into self.profile"""
+        start = time.time()
+        started = time.perf_counter()
+        bytes_before = self._total_bytes_read()
+        try:
+            yield
+        finally:
+            self.profile.append(
+                {
+                    "check": check,
+                    "file": file,
+                    "start": start,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                    "bytes_read": self._total_bytes_read() - bytes_before,
+                }
+            )
+
+    def report(
+        self,
+        severity: str,
+        rule_id: str,
+        message: str,
+        file: str = "SKILL.md",
+        line: int = None,
+    ):
+        """Record a finding with a stable rule id and its location
+
+        severity is "error", "warning" or "info"; file is relative to the
+        skill directory (None for the directory itself). Inside a frontmatter
+        rule, line defaults to the line of the field being checked.
+        """
+        if line is None and file == self.MAIN_FILE and self._field is not None:
+            line = self.document.field_lines.get(self._field)
+        {"error": self.errors, "warning": self.warnings, "info": self.info}[
+            severity
+        ].append(message)
+        self.diagnostics.append(
+            {
+                "rule": rule_id,
+                "severity": severity,
+                "message": message,
+                "file": file,
+                "line": line,
+            }
+        )
+
+    def _validate_structure(self):
+        """Validate basic directory structure"""
+        if not self.skill_path.exists():
+            self.report(
+                "error",
+                "structure.missing-directory",
+                f"Skill directory does not exist: {self.skill_path}",
+                file=None,
+            )
+            return
+
+        if not self.skill_path.is_dir():
+            self.report(
+                "error",
+                "structure.not-a-directory",
+                f"Path is not a directory: {self.skill_path}",
+                file=None,
+            )
+            return
+
+        skill_md = self.skill_path / "SKILL.md"
+        if not skill_md.exists():
+            self.report(
+                "error", "structure.missing-skill-md", "Missing required SKILL.md file"
+            )
+        elif not skill_md.is_file():
+            self.report(
+                "error",
+                "structure.skill-md-not-a-file",
+                "SKILL.md exists but is not a file",
+            )
+
+    def _validate_skill_file(self):
+        """Validate SKILL.md file structure"""
+        skill_md = self.skill_path / "SKILL.md"
+        if self.files is not None:
+            data = self.files.get("SKILL.md")
+            if data is None:
+                return
+        elif not skill_md.exists():
+            return
+        else:
+            data = None
+
+        try:
+            document = SkillDocument(skill_md, data)
+
+            # Check for YAML frontmatter
+            if not document.has_frontmatter:
+                self.report(
+                    "error",
+                    "frontmatter.missing",
+                    "SKILL.md must start with YAML frontmatter (---\\n)",
+                    line=1,
+                )
+                return
+
+            if not document.frontmatter_closed:
+                self.report(
+                    "error",
+                    "frontmatter.unclosed",
+                    "SKILL.md frontmatter must be closed with ---",
+                    line=1,
+                )
+                return
+
+            # Store for later validation
+            self.frontmatter_str = document.frontmatter_str
+            self.document = document
+
+        except Exception as e:
+            self.report("error", "skill-md.unreadable", f"Error reading SKILL.md: {e}")
+
+    def _validate_frontmatter(self):
+        """Validate YAML frontmatter content"""
+        if not hasattr(self, "frontmatter_str"):
+            return
+
+        frontmatter = parse_simple_frontmatter(self.frontmatter_str)
+        if frontmatter is None:
+            import yaml
+
+            try:
+                frontmatter = _load_yaml(self.frontmatter_str)
+            except yaml.YAMLError as e:
+                mark = getattr(e, "problem_mark", None)
+                self.report(
+                    "error",
+                    "frontmatter.invalid-yaml",
+                    f"Invalid YAML in frontmatter: {e}",
+                    line=mark.line + 2 if mark is not None else 2,
+                )
+                return
+
+        if not isinstance(frontmatter, dict):
+            self.report(
+                "error",
+                "frontmatter.not-a-mapping",
+                "Frontmatter must be a YAML dictionary",
+                line=2,
+            )
+            return
+
+        self.frontmatter = frontmatter
+
+        # Required fields
+        for field in self._required_fields():
+            if field not in frontmatter:
+                self.report(
+                    "error",
+                    "frontmatter.missing-field",
+                    f"Missing required field: {field}",
+                    line=1,
+                )
+
+        for rule in self._frontmatter_rules():
+            if rule.field in frontmatter:
+                self._run_rule(rule, frontmatter[rule.field])
+
+    def _required_fields(self):
+        return self.rules.required_frontmatter
+
+    def _frontmatter_rules(self) -> List[Rule]:
+        return self.rules.rules
+
+    def _run_rule(self, rule: Rule, value: Any):
+        """Run a frontmatter rule, attributing unreported messages to its id"""
+        lists = (self.errors, self.warnings, self.info)
+        counts = [len(messages) for messages in lists]
+        reported = len(self.diagnostics)
+
+        self._field = rule.field
+        try:
+            rule.check(self, value)
+        finally:
+            self._field = None
+
+        if len(self.diagnostics) > reported:
+            return
+        line = self.document.field_lines.get(rule.field)
+        for severity, messages, count in zip(("error", "warning", "info"), lists, counts):
+            for message in messages[count:]:
+                self.diagnostics.append(
+                    {
+                        "rule": rule.id,
+                        "severity": severity,
+                        "message": message,
+                        "file": self.MAIN_FILE,
+                        "line": line,
+                    }
+                )
+
+    @frontmatter_rule("name", "name")
+    def _validate_name(self, name: str):
+        """Validate skill name"""
+        if not isinstance(name, str):
+            self.report("error", "name.type", "name must be a string")
+            return
+
+        # Check against directory name
+        if name != self.skill_path.name:
+            self.report(
+                "error",
+                "name.directory-mismatch",
+                f"name '{name}' must match directory name '{self.skill_path.name}'",
+            )
+
+        # Regex validation
+        if not self.rules.name_re.match(name):
+            self.report(
+                "error",
+                "name.pattern",
+                "name must contain only lowercase letters, numbers, and single hyphens",
+            )
+
+        if len(name) < 1 or len(name) > self.rules.name_max_length:
+            self.report(
+                "error",
+                "name.length",
+                f"name must be 1-{self.rules.name_max_length} characters long",
+            )
+
+        if name.startswith("-") or name.endswith("-"):
+            self.report(
+                "error", "name.edge-hyphen", "name cannot start or end with a hyphen"
+            )
+
+        if "--" in name:
+            self.report(
+                "error",
+                "name.consecutive-hyphens",
+                "name cannot contain consecutive hyphens",
+            )
+
+    @frontmatter_rule("description", "description")
+    def _validate_description(self, description: str):
+        """Validate skill description"""
+        if not isinstance(description, str):
+            self.report("error", "description.type", "description must be a string")
+            return
+
+        desc_len = len(description)
+        if desc_len < self.rules.description_min_length:
+            self.report(
+                "error",
+                "description.too-short",
+                f"description must be at least {self.rules.description_min_length} characters long",
+            )
+        elif desc_len > self.rules.description_max_length:
+            self.report(
+                "error",
+                "description.too-long",
+                f"description must not exceed {self.rules.description_max_length} characters",
+            )
+
+        # Check for trigger indication
+        if not self.rules.trigger_re.search(description):
+            self.report(
+                "warning",
+                "description.no-trigger",
+                "description should indicate when to trigger the skill",
+            )
+
+    @frontmatter_rule("license", "license")
+    def _validate_license(self, license_str: str):
+        """Validate license field"""
+        if not isinstance(license_str, str):
+            self.report("error", "license.type", "license must be a string")
+            return
+
+        if license_str not in self.rules.license_set:
+            self.report(
+                "warning",
+                "license.non-standard",
+                f"Consider using a standard license (e.g., {', '.join(self.rules.common_licenses)})",
+            )
+
+    @frontmatter_rule("scope", "scope")
+    def _validate_scope(self, scope: str):
+        """Validate scope field"""
+        if not isinstance(scope, str):
+            self.report("error", "scope.type", "scope must be a string")
+            return
+
+        if scope not in self.rules.scopes:
+            self.report(
+                "error",
+                "scope.invalid",
+                "scope must be either " + " or ".join(f"'{s}'" for s in self.rules.scopes),
+            )
+            return
+
+        # Project skills override global ones, so a skill in the wrong
+        # directory does not behave the way its scope says
+        installed_scope = scope_of_path(self.skill_path)
+        if installed_scope is not None and installed_scope != scope:
+            self.report(
+                "warning",
+                "scope.location-mismatch",
+                f"scope is '{scope}' but the skill is installed in the "
+                f"{installed_scope} skill directory",
+            )
+
+    def _validate_content(self):
+        """Validate skill body content"""
+        if not hasattr(self, "document"):
+            return
+
+        try:
+            self.body_index = BodyIndex.scan(
+                self.document.iter_body_lines(), self.document.body_line
+            )
+        except (OSError, UnicodeDecodeError) as e:
+            self.report("error", "skill-md.unreadable", f"Error reading SKILL.md: {e}")
+            return
+
+        # Check for required sections
+        required_sections = [
+            "What this skill does",
+            "When to use this skill",
+            "Instructions",
+        ]
+        for section in required_sections:
+            if self.body_index.find_heading(section) is None:
+                self.report(
+                    "warning",
+                    "content.missing-section",
+                    f"Consider adding section: ## {section}",
+                )
+
+        # Content length check
+        lines = self.body_index.line_count
+        if lines > 500:
+            self.report(
+                "warning",
+                "content.too-long",
+                f"SKILL.md is quite long ({lines} lines). Consider moving detailed content to reference files",
+            )
+
+        # Check for examples
+        if self.body_index.find_heading("Example") is None:
+            self.report(
+                "info",
+                "content.no-examples",
+                "Consider adding examples to improve skill usability",
+            )
+
+        self._validate_token_budget()
+
+    def _validate_token_budget(self):
+        """Flag sections and a SKILL.md too costly to load on every trigger
+
+        A section's size in characters bounds its tokens from above, so the
+        body is only read again when something may be over budget.
+        """
+        index = self.body_index
+        if self.document.body_offset is None:
+            return
+        rules = self.rules
+        if (
+            all(section.size <= rules.section_max_tokens for section in index.sections)
+            and self.document.body_offset + index.size <= rules.eager_max_tokens
+        ):
+            return
+
+        try:
+            body_lines = list(self.document.iter_body_lines())
+        except (OSError, UnicodeDecodeError):
+            return
+        tokens = section_tokens(body_lines, self.document.body_line, index.sections)
+        for section, section_cost in zip(index.sections, tokens):
+            if section_cost > rules.section_max_tokens:
+                self.report(
+                    "warning",
+                    "content.section-too-large",
+                    f"{section_label(section)} is ~{section_cost} tokens "
+                    f"(budget {rules.section_max_tokens}); consider moving it to "
+                    f"{reference_name(section)}",
+                    line=section.line,
+                )
+
+        # Both --- fences are three tokens each
+        eager_tokens = sum(tokens) + estimate_tokens(self.document.frontmatter_str) + 6
+        if eager_tokens > rules.eager_max_tokens:
+            self.report(
+                "warning",
+                "content.eager-cost",
+                f"SKILL.md loads ~{eager_tokens} tokens into context whenever the "
+                f"skill triggers (budget {rules.eager_max_tokens}); move detail to references/",
+            )
+
+    def _validate_optional_structure(self):
+        """Validate optional directory structure"""
+        if not self.skill_path.is_dir():
+            return
+        # One walk answers every question about the skill's files below
+        self.tree = SkillTree.scan(self.skill_path)
+
+        if "scripts" in self.tree.files:
+            self.report(
+                "error",
+                "structure.scripts-not-a-directory",
+                "scripts exists but is not a directory",
+                file="scripts",
+            )
+        elif "scripts" in self.tree.dirs:
+            # Validate script files
+            script_files = [
+                self.skill_path / relative_path
+                for relative_path in sorted(self.tree.files)
+                if relative_path.startswith("scripts/")
+                and relative_path.count("/") == 1
+                and relative_path.endswith((".py", ".sh"))
+            ]
+            shell_scripts = [f for f in script_files if f.suffix == ".sh"]
+            shellcheck_results = {}
+            if shell_scripts and shellcheck_path() is not None:
+                with self._span("shellcheck"):
+                    shellcheck_results = self._run_shellcheck(shell_scripts)
+            for script_file in script_files:
+                # Nested inside the optional_structure span
+                with self._span("script", f"scripts/{script_file.name}"):
+                    self._validate_script_file(
+                        script_file, shellcheck_results.get(script_file)
+                    )
+
+        for directory in ("references", "assets"):
+            if directory in self.tree.files:
+                self.report(
+                    "error",
+                    f"structure.{directory}-not-a-directory",
+                    f"{directory} exists but is not a directory",
+                    file=directory,
+                )
+            elif directory in self.tree.dirs:
+                self.report(
+                    "info",
+                    f"structure.{directory}-count",
+                    f"Found {self.tree.entry_counts.get(directory, 0)} files "
+                    f"in {directory}/",
+                    file=directory,
+                )
+
+    def _validate_links(self):
+        """Check relative links and images, and find files nothing refers to
+
+        SKILL.md and every Markdown file outside assets/ are checked for
+        broken links; assets are output material such as templates, whose
+        links point into the skill they will become. Files under
+        references/ and assets/ that can't be reached from SKILL.md by
+        following links and path mentions are reported as orphaned.
+        """
+        if not hasattr(self, "body_index") or not hasattr(self, "tree"):
+            return
+
+        indexes = {"SKILL.md": self.body_index}
+        for relative_path in sorted(self.tree.files):
+            if (
+                relative_path.endswith(".md")
+                and relative_path != "SKILL.md"
+                and not relative_path.startswith("assets/")
+            ):
+                markdown = self._scan_markdown(relative_path)
+                if markdown is not None:
+                    indexes[relative_path] = markdown
+
+        # Where each file points, with broken links reported on the way
+        edges = {}
+        for source, index in indexes.items():
+            targets = set()
+            for link in index.links:
+                path = self.tree.resolve(source, link.target)
+                if path is None:
+                    # Outside the skill, e.g. a sibling skill
+                    continue
+                if path in self.tree:
+                    targets.add(path)
+                else:
+                    kind = "image" if link.image else "link"
+                    self.report(
+                        "warning",
+                        "link.dangling",
+                        f"Broken {kind} to {link.target}",
+                        file=source,
+                        line=link.line,
+                    )
+            # Mentions are written relative to the skill directory
+            for mention in index.mentions:
+                path = self.tree.resolve("SKILL.md", mention)
+                if path is not None and path in self.tree:
+                    targets.add(path)
+            edges[source] = targets
+
+        referenced = set()
+        queue = ["SKILL.md"]
+        while queue:
+            for path in edges.get(queue.pop(), ()):
+                if path not in referenced:
+                    referenced.add(path)
+                    queue.append(path)
+
+        for relative_path in sorted(self.tree.files):
+            if not relative_path.startswith(("references/", "assets/")):
+                continue
+            # A link to a directory covers everything in it
+            parent = relative_path
+            while parent and parent not in referenced:
+                parent = posixpath.dirname(parent)
+            if not parent:
+                self.report(
+                    "info",
+                    "link.orphaned-file",
+                    f"{relative_path} is not linked from SKILL.md or its references",
+                    file=relative_path,
+                )
+
+    def _scan_markdown(self, relative_path: str) -> BodyIndex:
+        """Index another Markdown file of the skill, or None if unreadable"""
+        try:
+            if self.files is not None:
+                data = self.files[relative_path]
+            else:
+                with open(self.skill_path / relative_path, "rb") as f:
+                    data = f.read()
+                self.bytes_read += len(data)
+        except OSError:
+            return None
+        return BodyIndex.scan(iter(data.decode("utf-8", "replace").splitlines(True)))
+
+    def _validate_rendered_scripts(self):
+        """Check the syntax of rendered Python scripts"""
+        for relative_path in sorted(self.files):
+            if relative_path.startswith("scripts/") and relative_path.endswith(".py"):
+                with self._span("script", relative_path):
+                    self._validate_script_file(self.skill_path / relative_path)
+
+    def _read_script(self, script_file: Path) -> bytes:
+        if self.files is not None:
+            return self.files[f"scripts/{script_file.name}"]
+        with open(script_file, "rb") as f:
+            data = f.read()
+        self.bytes_read += len(data)
+        return data
+
+    def _cached_check(self, kind: str, name: str, data: bytes, check) -> list:
+        """Run a script check unless the cache has a result for this content"""
+        if self.script_cache is None:
+            return check()
+        key = self.script_cache.key(kind, name, data)
+        diagnostics = self.script_cache.get(key)
+        if diagnostics is None:
+            diagnostics = check()
+            # Don't remember a tool that failed to run
+            if not any(rule_id.endswith("-failed") for _, rule_id, _, _ in diagnostics):
+                self.script_cache.put(key, diagnostics)
+        return diagnostics
+
+    def _run_shellcheck(self, script_files: List[Path]) -> Dict[Path, list]:
+        """shellcheck diagnostics per shell script, if shellcheck is installed"""
+        if not script_files or shellcheck_path() is None or self.files is not None:
+            return {}
+
+        def check(script_file: Path) -> list:
+            try:
+                data = self._read_script(script_file)
+            except OSError:
+                return []
+            return self._cached_check(
+                "shellcheck",
+                script_file.name,
+                data,
+                lambda: check_shell(script_file.name, script_file),
+            )
+
+        if len(script_files) == 1:
+            return {script_files[0]: check(script_files[0])}
+
+        # Each check is an external process, so threads overlap them well
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(script_files))) as executor:
+            return dict(zip(script_files, executor.map(check, script_files)))
+
+    def _validate_script_file(self, script_file: Path, shellcheck: list = None):
+        """Validate individual script files"""
+        relative_path = f"scripts/{script_file.name}"
+        if script_file.suffix == ".py":
+            data = self._read_script(script_file)
+            diagnostics = self._cached_check(
+                "python",
+                script_file.name,
+                data,
+                lambda: check_python(script_file.name, data),
+            )
+            for severity, rule_id, message, line in diagnostics:
+                self.report(severity, rule_id, message, file=relative_path, line=line)
+            if not diagnostics:
+                self.report(
+                    "info",
+                    "script.syntax-ok",
+                    f"Python script {script_file.name} syntax is valid",
+                    file=relative_path,
+                )
+
+        elif script_file.suffix == ".sh":
+            if self.files is None:
+                self._check_executable(script_file)
+            for severity, rule_id, message, line in shellcheck or ():
+                self.report(severity, rule_id, message, file=relative_path, line=line)
+
+    def _check_executable(self, script_file: Path):
+        """Report shell scripts without an executable bit, or set it with fix"""
+        relative_path = f"scripts/{script_file.name}"
+        mode = script_file.stat().st_mode
+        if mode & 0o111:
+            return
+
+        if not self.fix:
+            self.report(
+                "warning",
+                "script.not-executable",
+                f"Shell script {script_file.name} is not executable "
+                "(use --fix to make it executable)",
+                file=relative_path,
+            )
+            return
+
+        try:
+            # Executable for everyone who can read it
+            script_file.chmod((mode & 0o7777) | ((mode & 0o444) >> 2))
+            self.report(
+                "info",
+                "script.made-executable",
+                f"Made shell script {script_file.name} executable",
+                file=relative_path,
+            )
+        except OSError as e:
+            self.report(
+                "warning",
+                "script.not-executable",
+                f"Could not make {script_file.name} executable: {e}",
+                file=relative_path,
+            )
@@ -0,0 +1,375 @@
+"""
+Skill Watch Daemon for OpenCode Skills
+
+Keeps a warm validator running, watches skill trees for changes and
+re-validates only the skills whose files changed. Results are streamed as
+JSON lines on stdout and, optionally, served over a local Unix socket.
+Usage: python validate.py <root> [<root> ...] --watch [--socket PATH] [--poll]
+
+Uses inotify on Linux and falls back to polling elsewhere.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import signal
+import socket
+import stat
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from .bulk import validate_many
+from .discovery import AGENT_DIR_NAMES, SKIP_DIRS, collect_skill_paths
+from .cache import ValidationCache
+from .rules import load_rules
+
+# Quiet period that groups the burst of events from a single save
+DEBOUNCE_SECONDS = 0.1
+
+
+class PollingWatcher:
+    """Detect changes by comparing stat snapshots of the watched trees"""
+
+    def __init__(self, roots: List[str], interval: float = 1.0):
+        self.roots = [str(Path(root).resolve()) for root in roots]
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, tuple]:
+        snapshot = {}
+        for root in self.roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def changes(self) -> Iterator[Set[str]]:
+        """Yield the set of changed paths after every poll that finds any"""
+        while True:
+            time.sleep(self.interval)
+            current = self._scan()
+            changed = {
+                path
+                for path in current.keys() | self.snapshot.keys()
+                if current.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = current
+            if changed:
+                yield changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Detect changes with Linux inotify through ctypes, one watch per directory"""
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+
+    MASK = (
+        IN_MODIFY
+        | IN_ATTRIB
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+    )
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, roots: List[str]):
+        libc_name = ctypes.util.find_library("c")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.roots = [str(Path(root).resolve()) for root in roots]
+        self.watches: Dict[int, str] = {}
+        for root in self.roots:
+            self._add_tree(root)
+
+    def _add_tree(self, top: str):
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), self.MASK)
+            if wd >= 0:
+                self.watches[wd] = dirpath
+
+    def _read_events(self) -> Set[str]:
+        data = os.read(self.fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were lost; report every root so everything is rechecked
+                changed.update(self.roots)
+                continue
+
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            if mask & self.IN_IGNORED:
+                del self.watches[wd]
+                continue
+
+            path = os.path.join(directory, os.fsdecode(name)) if name else directory
+            changed.add(path)
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                if os.path.basename(path) not in SKIP_DIRS:
+                    self._add_tree(path)
+        return changed
+
+    def changes(self) -> Iterator[Set[str]]:
+        """Yield the set of changed paths once a burst of events settles"""
+        while True:
+            select.select([self.fd], [], [])
+            changed = self._read_events()
+            while select.select([self.fd], [], [], DEBOUNCE_SECONDS)[0]:
+                changed |= self._read_events()
+            if changed:
+                yield changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class ResultServer:
+    """Serve validation results as JSON lines over a Unix socket
+
+    A client receives every current result, then a {"event": "ready"} line,
+    and then stays subscribed to further updates until it disconnects.
+    """
+
+    def __init__(self, socket_path: str, snapshot):
+        self.socket_path = socket_path
+        self.snapshot = snapshot
+        self.clients: List[socket.socket] = []
+        self.lock = threading.Lock()
+
+        # Never replace a file that is not a stale socket
+        if os.path.lexists(socket_path):
+            if not _is_socket(socket_path):
+                raise ValueError(f"{socket_path} exists and is not a socket")
+            os.unlink(socket_path)
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(socket_path)
+        os.chmod(socket_path, 0o600)
+        self.server.listen()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self.server.accept()
+            except OSError:
+                return
+            with self.lock:
+                lines = [_encode(record) for record in self.snapshot()]
+                lines.append(_encode({"event": "ready"}))
+                try:
+                    client.sendall(b"".join(lines))
+                except OSError:
+                    client.close()
+                    continue
+                self.clients.append(client)
+
+    def broadcast(self, record: Dict[str, Any]):
+        line = _encode(record)
+        with self.lock:
+            for client in list(self.clients):
+                try:
+                    client.sendall(line)
+                except OSError:
+                    client.close()
+                    self.clients.remove(client)
+
+    def close(self):
+        self.server.close()
+        with self.lock:
+            for client in self.clients:
+                client.close()
+        if _is_socket(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def _is_socket(path: str) -> bool:
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+class WatchDaemon:
+    """Validate every skill and agent file once, then re-validate them as their
+    files change"""
+
+    def __init__(
+        self,
+        roots: List[str],
+        cache: Optional[ValidationCache] = None,
+        config_path: str = None,
+        workers: int = None,
+        socket_path: str = None,
+        poll: bool = False,
+        poll_interval: float = 1.0,
+    ):
+        self.roots = [str(Path(root).resolve()) for root in roots]
+        self.cache = cache
+        self.config_path = config_path
+        self.workers = workers
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+
+        # Warm the rule set before the first change arrives
+        load_rules(config_path)
+
+        self.watcher = None
+        if not poll:
+            try:
+                self.watcher = InotifyWatcher(self.roots)
+            except (OSError, AttributeError):
+                self.watcher = None
+        if self.watcher is None:
+            self.watcher = PollingWatcher(self.roots, poll_interval)
+
+        try:
+            self.server = ResultServer(socket_path, self._snapshot) if socket_path else None
+        except (OSError, ValueError):
+            self.watcher.close()
+            raise
+
+    def _snapshot(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            return [
+                {"event": "result", **result} for result in self.results.values()
+            ]
+
+    def _emit(self, record: Dict[str, Any]):
+        sys.stdout.write(json.dumps(record) + "\n")
+        sys.stdout.flush()
+        if self.server is not None:
+            self.server.broadcast(record)
+
+    def _validate(self, skill_paths: List[str], workers: int = None):
+        for result in validate_many(skill_paths, workers, self.cache, self.config_path):
+            with self.lock:
+                self.results[result["skill_path"]] = result
+            self._emit({"event": "result", **result})
+
+    def _affected_skills(self, changed: Set[str]) -> Set[str]:
+        """Map changed paths to their skill directories, and agent files to
+        themselves"""
+        skills = set()
+        for path in changed:
+            if os.path.basename(path) == "__pycache__" or "/__pycache__/" in path:
+                continue
+            if path in self.roots:
+                # A root-level event (e.g. queue overflow): rescan the whole tree
+                skills.update(collect_skill_paths([path], agents=True)[0])
+                skills.update(self.results)
+                continue
+            if path in self.results:
+                # A known agent file
+                skills.add(path)
+                continue
+
+            directory = path
+            while directory and directory != os.path.dirname(directory):
+                if directory in self.results or os.path.isfile(
+                    os.path.join(directory, "SKILL.md")
+                ):
+                    skills.add(directory)
+                    break
+                directory = os.path.dirname(directory)
+            else:
+                if os.path.isdir(path):
+                    # A directory created or moved in arrives as one event;
+                    # the skills and agent files inside it never do
+                    skills.update(collect_skill_paths([path], agents=True)[0])
+                # Outside any skill: a new agent file
+                elif path.endswith(".md") and (
+                    os.path.basename(os.path.dirname(path)) in AGENT_DIR_NAMES
+                ):
+                    skills.add(path)
+        return {str(Path(skill).resolve()) for skill in skills}
+
+    def run(self):
+        skill_paths, _ = collect_skill_paths(self.roots, agents=True)
+        self._validate(skill_paths, self.workers)
+        self._emit({"event": "ready", "skills": len(self.results)})
+
+        for changed in self.watcher.changes():
+            affected = self._affected_skills(changed)
+            present = sorted(p for p in affected if os.path.exists(p))
+            for skill_path in sorted(affected - set(present)):
+                with self.lock:
+                    removed = self.results.pop(skill_path, None)
+                if removed is not None:
+                    self._emit({"event": "removed", "skill_path": skill_path})
+            if present:
+                # Small batches are cheaper in-process than through a pool
+                self._validate(present, 1 if len(present) < 8 else self.workers)
+
+    def close(self):
+        self.watcher.close()
+        if self.server is not None:
+            self.server.close()
+
+
+def watch(roots: List[str], **options) -> int:
+    """Run the watch daemon until interrupted or terminated"""
+    try:
+        daemon = WatchDaemon(roots, **options)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not start watching: {e}", file=sys.stderr)
+        return 1
+
+    def terminate(signum, frame):
+        raise KeyboardInterrupt
+
+    # SIGTERM takes the same way out as Ctrl-C, so the socket is removed
+    previous = signal.signal(signal.SIGTERM, terminate)
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+        signal.signal(signal.SIGTERM, previous)
+    return 0
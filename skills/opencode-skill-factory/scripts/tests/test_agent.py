@@ -0,0 +1,31 @@
+"""Regression cases for AgentValidator"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from skillfactory.agent import AgentValidator  # noqa: E402
+
+
+def _validate(tmp_path, frontmatter):
+    agent_file = tmp_path / "agent" / "reviewer.md"
+    agent_file.parent.mkdir()
+    agent_file.write_text(
+        f"---\ndescription: Reviews code for correctness and style\n{frontmatter}---\n"
+        "You review code.\n",
+        encoding="utf-8",
+    )
+    return AgentValidator(agent_file).validate()
+
+
+def test_list_valued_permission_is_reported_not_raised(tmp_path):
+    result = _validate(tmp_path, "tools:\n  edit: false\npermission:\n  edit: [allow]\n")
+    assert not result["valid"]
+
+
+def test_list_valued_bash_permission_map(tmp_path):
+    result = _validate(
+        tmp_path, "tools:\n  bash: true\npermission:\n  bash:\n    'git *': [deny]\n"
+    )
+    assert not result["valid"]
@@ -0,0 +1,24 @@
+"""Regression cases for SkillTree and the checks built on it"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from skillfactory.tree import SkillTree  # noqa: E402
+from skillfactory.validator import SkillValidator  # noqa: E402
+
+
+def test_dangling_symlink_is_not_a_file(tmp_path):
+    skill = tmp_path / "demo-skill"
+    (skill / "scripts").mkdir(parents=True)
+    (skill / "SKILL.md").write_text(
+        "---\nname: demo-skill\ndescription: Demo skill used when testing the validator\n"
+        "---\n# Demo\n",
+        encoding="utf-8",
+    )
+    os.symlink(skill / "missing.py", skill / "scripts" / "broken.py")
+
+    assert "scripts/broken.py" not in SkillTree.scan(skill).files
+    SkillValidator(skill).validate()
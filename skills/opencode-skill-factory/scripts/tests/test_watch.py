@@ -0,0 +1,62 @@
+"""Regression cases for the watch daemon"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from skillfactory.watch import InotifyWatcher, WatchDaemon  # noqa: E402
+
+
+def _write_skill(skill: Path):
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text(
+        f"---\nname: {skill.name}\ndescription: Demo skill used when testing the watcher\n"
+        "---\n# Demo\n",
+        encoding="utf-8",
+    )
+
+
+def test_directory_moved_into_root_is_scanned(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    incoming = tmp_path / "incoming"
+    _write_skill(incoming / "group" / "first-skill")
+    _write_skill(incoming / "second-skill")
+    (incoming / "agent").mkdir()
+    (incoming / "agent" / "reviewer.md").write_text("---\n---\n", encoding="utf-8")
+
+    daemon = WatchDaemon([str(root)], poll=True)
+    try:
+        os.rename(incoming, root / "incoming")
+        affected = daemon._affected_skills({str(root / "incoming")})
+    finally:
+        daemon.close()
+
+    moved = root.resolve() / "incoming"
+    assert affected == {
+        str(moved / "group" / "first-skill"),
+        str(moved / "second-skill"),
+        str(moved / "agent" / "reviewer.md"),
+    }
+
+
+def test_inotify_reports_directory_moved_into_root(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _write_skill(tmp_path / "incoming" / "demo-skill")
+    try:
+        watcher = InotifyWatcher([str(root)])
+    except (OSError, AttributeError):
+        pytest.skip("inotify is not available")
+
+    try:
+        os.rename(tmp_path / "incoming", root / "incoming")
+        changed = watcher._read_events()
+    finally:
+        watcher.close()
+
+    assert str(root.resolve() / "incoming") in changed